@@ -15,6 +15,7 @@ Purpose: Encapsulate CSV-specific conversion logic as a pluggable component
 
 import csv
 import logging
+from collections.abc import Sequence
 from pathlib import Path
 from typing import List, Dict, Any
 import pandas as pd
@@ -168,7 +169,8 @@ class CSVConverter(BaseConverter):
 
         Educational Note:
         Tabular data has:
-        - 'rows' field containing list of dictionaries
+        - 'rows' field containing a list (or sequence) of dictionaries,
+          or 'arrays' with one array per column (CSVParser(columnar=True))
         - 'columns' field containing column names
 
         This is the format output by the CSV parser.
@@ -179,10 +181,14 @@ class CSVConverter(BaseConverter):
         Returns:
             True if data is tabular
         """
+        if 'columns' not in data.data:
+            return False
+        if 'arrays' in data.data:
+            return True
         return (
             'rows' in data.data and
-            'columns' in data.data and
-            isinstance(data.data.get('rows'), list)
+            isinstance(data.data.get('rows'), Sequence) and
+            not isinstance(data.data.get('rows'), str)
         )
 
     def _convert_tabular(self, data: IntermediateData, output_path: Path) -> None:
@@ -201,11 +207,15 @@ class CSVConverter(BaseConverter):
             ConverterError: If writing fails
         """
         try:
-            rows = data.data['rows']
             columns = data.data['columns']
 
-            # Create DataFrame from rows
-            df = pd.DataFrame(rows, columns=columns)
+            if 'arrays' in data.data:
+                # Columnar layout: one array per column, no row dicts needed
+                df = pd.DataFrame(dict(enumerate(data.data['arrays'])))
+                df.columns = columns
+            else:
+                # Create DataFrame from rows
+                df = pd.DataFrame(data.data['rows'], columns=columns)
 
             # Optionally add metadata rows at the top
             if self._include_metadata and data.metadata:
@@ -241,7 +251,7 @@ class CSVConverter(BaseConverter):
                 )
 
             logger.debug(
-                f"Tabular CSV written: {len(rows)} rows, {len(columns)} columns"
+                f"Tabular CSV written: {len(df)} rows, {len(columns)} columns"
             )
 
         except Exception as e:
@@ -290,6 +300,9 @@ class CSVConverter(BaseConverter):
                 if isinstance(value, (dict, list)):
                     # For complex types, convert to string representation
                     rows.append({'Field': key, 'Value': str(value)})
+                elif isinstance(value, Sequence) and not isinstance(value, str):
+                    # Lazy sequences (e.g. log entry views) print as lists
+                    rows.append({'Field': key, 'Value': str(list(value))})
                 else:
                     rows.append({'Field': key, 'Value': value})
 
@@ -15,18 +15,26 @@ Purpose: Encapsulate JSON-specific conversion logic as a pluggable component
 
 import json
 import logging
+import os
+from collections.abc import Sequence
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
 from data_alchemist.core.interfaces import BaseConverter
 from data_alchemist.core.models import IntermediateData, ConverterError
 
 logger = logging.getLogger(__name__)
 
+# Output file buffer; streamed JSON arrives in many small pieces
+_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """
-    Custom JSON encoder that handles datetime objects.
+    Custom JSON encoder that handles datetime objects, lazy sequences and
+    NumPy arrays.
 
     Educational Note:
     Python's datetime objects aren't directly JSON-serializable.
@@ -54,6 +62,14 @@ class DateTimeEncoder(json.JSONEncoder):
             # Convert datetime to ISO format string
             return obj.isoformat()
 
+        if isinstance(obj, Sequence):
+            # Lazy sequences (e.g. CSV row views) serialize as lists
+            return list(obj)
+
+        if isinstance(obj, (np.ndarray, np.generic)):
+            # Columnar CSV arrays and NumPy scalars -> native Python values
+            return obj.tolist()
+
         # Let the base class handle other types (or raise TypeError)
         return super().default(obj)
 
@@ -137,10 +153,19 @@ class JSONConverter(BaseConverter):
         Conversion process:
         1. Validate IntermediateData structure
         2. Convert to JSON-serializable dictionary
-        3. Serialize to JSON string with custom encoder
+        3. Serialize to JSON with custom encoder, straight into the file
         4. Write to file with UTF-8 encoding
         5. Handle errors gracefully
 
+        Indented JSON is always encoded by the pure-Python encoder (the C
+        accelerator only handles compact output), so building the whole
+        document as one string first buys nothing - it just holds the
+        string and its UTF-8 copy in memory at once. Indented output is
+        therefore streamed piece by piece through a 1 MiB buffer; compact
+        output keeps the one-shot C encoder, which is ~2.5x faster than
+        streaming. Either way the JSON goes to a temporary file that is
+        renamed over output_path only once it is complete.
+
         Args:
             data: Intermediate data to convert
             output_path: Path where JSON file should be written
@@ -178,45 +203,64 @@ class JSONConverter(BaseConverter):
                 f"Failed to convert IntermediateData to dictionary: {e}"
             )
 
-        # Serialize to JSON
-        try:
-            json_string = json.dumps(
-                output_dict,
-                cls=DateTimeEncoder,
-                indent=self._indent,
-                sort_keys=self._sort_keys,
-                ensure_ascii=False  # Allow Unicode characters
-            )
-        except (TypeError, ValueError) as e:
-            raise ConverterError(
-                f"Failed to serialize data to JSON: {e}\n"
-                f"Tip: Ensure all data values are JSON-serializable"
-            )
-
-        # Write to file
+        # Serialize to a temporary file next to the output, then rename it
+        # into place, so a failure never leaves a truncated JSON file
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        encoder = DateTimeEncoder(
+            indent=self._indent,
+            sort_keys=self._sort_keys,
+            ensure_ascii=False  # Allow Unicode characters
+        )
         try:
             # Create parent directory if it doesn't exist
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write JSON to file with UTF-8 encoding
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json_string)
+            with open(tmp_path, 'w', encoding='utf-8',
+                      buffering=_WRITE_BUFFER_SIZE) as f:
+                if self._indent is None:
+                    # Compact output: one-shot dumps uses the C encoder
+                    f.write(encoder.encode(output_dict))
+                else:
+                    # Indented output is encoded in Python either way;
+                    # stream the pieces instead of joining them first
+                    write = f.write
+                    for chunk in encoder.iterencode(output_dict):
+                        write(chunk)
+
+            os.replace(tmp_path, output_path)
 
             logger.info(
                 f"JSON conversion complete: {output_path} "
-                f"({len(json_string)} characters)"
+                f"({output_path.stat().st_size} bytes)"
             )
 
+        except (TypeError, ValueError) as e:
+            self._discard(tmp_path)
+            raise ConverterError(
+                f"Failed to serialize data to JSON: {e}\n"
+                f"Tip: Ensure all data values are JSON-serializable"
+            )
         except IOError as e:
+            self._discard(tmp_path)
             raise ConverterError(
                 f"Failed to write JSON to {output_path}: {e}\n"
                 f"Tip: Check file permissions and disk space"
             )
         except Exception as e:
+            self._discard(tmp_path)
             raise ConverterError(
                 f"Unexpected error writing JSON to {output_path}: {e}"
             )
 
+    @staticmethod
+    def _discard(tmp_path: Path) -> None:
+        """Remove a partially written temporary file, if any."""
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
     def _intermediate_to_dict(self, data: IntermediateData) -> dict:
         """
         Convert IntermediateData to a JSON-serializable dictionary.
@@ -2,13 +2,14 @@
 Core components of Data Alchemist.
 
 This package contains:
-- Data models (IntermediateData, exceptions)
+- Data models (IntermediateData, RowView, exceptions)
 - Abstract interfaces (BaseParser, BaseConverter)
 - Plugin management (PluginManager)
 """
 
 from data_alchemist.core.models import (
     IntermediateData,
+    RowView,
     DataAlchemistError,
     DetectionError,
     ParserError,
@@ -25,6 +26,7 @@ from data_alchemist.core.plugin_manager import PluginManager
 __all__ = [
     # Models
     'IntermediateData',
+    'RowView',
 
     # Exceptions
     'DataAlchemistError',
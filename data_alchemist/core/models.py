@@ -11,6 +11,7 @@ Educational Notes:
 - Warnings list enables parsers to flag issues without failing
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from datetime import datetime
@@ -229,3 +230,55 @@ class IntermediateData:
             >>> data.add_metadata('encoding', 'PCM')
         """
         self.metadata[key] = value
+
+
+# ============================================================================
+# Data Views
+# ============================================================================
+
+class RowView(Sequence):
+    """
+    Lazy, read-only sequence of row dictionaries over column arrays.
+
+    Parsers that produce many uniform records (CSV rows, log entries)
+    store them column-wise and expose this view in place of a list of
+    dicts.
+
+    Educational Note:
+    Building one dict per row up front (DataFrame.to_dict('records'))
+    allocates rows x columns Python objects before anyone reads them.
+    This view keeps the data column-wise (structure of arrays) and only
+    builds a row dict when that row is actually accessed, so consumers
+    that read a few rows - or stream them once - pay far less.
+
+    It behaves like the list it replaces: len(), indexing, negative
+    indices, slicing (returns a list of dicts) and iteration all work.
+    """
+
+    __slots__ = ('_names', '_cols', '_n')
+
+    def __init__(self, names: List[str], columns: List[Any], row_count: int):
+        self._names = names
+        self._cols = columns
+        self._n = row_count
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._n))]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("row index out of range")
+        return {name: col[index] for name, col in zip(self._names, self._cols)}
+
+    def __iter__(self):
+        # Walk all columns in lockstep: one pass, no per-cell indexing
+        names = self._names
+        for values in zip(*self._cols):
+            yield dict(zip(names, values))
+
+    def __repr__(self) -> str:
+        return f"<rows: {self._n} x {len(self._names)} columns>"
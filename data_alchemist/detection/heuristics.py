@@ -13,8 +13,10 @@ Design Pattern: Strategy Pattern
 Purpose: Encapsulate different detection algorithms that can be combined
 """
 
+import heapq
 import logging
 import re
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
@@ -528,12 +530,10 @@ def is_detection_ambiguous(
         # Only one type detected or no types - not ambiguous
         return False, all_results
 
-    # Sort by confidence (highest first)
-    sorted_types = sorted(all_results.items(), key=lambda x: x[1], reverse=True)
-
-    # Get top two confidence scores
-    top_confidence = sorted_types[0][1]
-    second_confidence = sorted_types[1][1]
+    # Get the two highest-confidence matches (no need to sort everything)
+    top_two = heapq.nlargest(2, all_results.items(), key=itemgetter(1))
+    top_confidence = top_two[0][1]
+    second_confidence = top_two[1][1]
 
     # Ambiguous if top scores are close
     is_ambiguous = (top_confidence - second_confidence) <= confidence_threshold
@@ -541,8 +541,8 @@ def is_detection_ambiguous(
     if is_ambiguous:
         logger.warning(
             f"Ambiguous detection for {file_path}: "
-            f"{sorted_types[0][0]} ({top_confidence:.0%}) vs "
-            f"{sorted_types[1][0]} ({second_confidence:.0%})"
+            f"{top_two[0][0]} ({top_confidence:.0%}) vs "
+            f"{top_two[1][0]} ({second_confidence:.0%})"
         )
 
     return is_ambiguous, all_results
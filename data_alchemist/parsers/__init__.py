@@ -13,11 +13,12 @@ Available Parsers:
 from data_alchemist.parsers.csv_parser import CSVParser
 from data_alchemist.parsers.log_parser import LogParser
 from data_alchemist.parsers.wav_parser import WAVParser
-from data_alchemist.parsers.image_parser import ImageParser
+from data_alchemist.parsers.image_parser import ImageParser, ParseFlags
 
 __all__ = [
     'CSVParser',
     'LogParser',
     'WAVParser',
     'ImageParser',
+    'ParseFlags',
 ]
@@ -13,32 +13,607 @@ Design Pattern: Plugin Pattern + Strategy Pattern
 Purpose: Encapsulate image-specific parsing logic as a pluggable component
 """
 
+import importlib.util
 import logging
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntFlag
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
 
 from data_alchemist.core.interfaces import BaseParser
 from data_alchemist.core.models import IntermediateData, ParserError
 from data_alchemist.utils.validation import (
     validate_file_for_parsing,
     timeout,
-    DEFAULT_PARSE_TIMEOUT
+    DEFAULT_PARSE_TIMEOUT,
+    MAX_IMAGE_FILE_SIZE
 )
 
+# Per-file log calls pass %-style arguments instead of f-strings: the
+# message is only formatted if its level is enabled, so a directory scan
+# with debug logging off does no string formatting for skipped files
 logger = logging.getLogger(__name__)
 
-# Lazy import Pillow to avoid requiring it for non-image operations
-try:
-    from PIL import Image, ExifTags
-    PILLOW_AVAILABLE = True
-except ImportError:
-    PILLOW_AVAILABLE = False
+# Pillow is only located here; it is imported on first use (_get_pil), so
+# importing this module - or parsing plain PNG/JPEG headers - never loads it
+PILLOW_AVAILABLE = importlib.util.find_spec('PIL') is not None
+if not PILLOW_AVAILABLE:
     logger.warning(
         "Pillow not available - Image parsing will be limited. "
         "Install Pillow for full image support: pip install Pillow"
     )
 
 
+_SUPPORTED_FORMATS = frozenset({'.png', '.jpg', '.jpeg'})
+_SUPPORTED_FORMATS_LIST = ['.png', '.jpg', '.jpeg']
+
+# Scalar img.info entries reported as metadata['image_info']. Only these
+# keys are looked up, so large ancillary values (ICC profiles, text
+# chunks, embedded EXIF bytes) are never touched.
+_INFO_KEYS = (
+    'gamma', 'srgb', 'interlace',
+    'jfif', 'jfif_unit', 'adobe', 'adobe_transform',
+    'progressive', 'progression', 'loop', 'duration',
+)
+
+# Human-readable color mode names (built once, not per parsed image)
+_MODE_DESCRIPTIONS = {
+    '1': '1-bit black and white',
+    'L': '8-bit grayscale',
+    'P': '8-bit palette',
+    'RGB': '24-bit true color (RGB)',
+    'RGBA': '32-bit true color with alpha (RGBA)',
+    'CMYK': 'CMYK color',
+    'YCbCr': 'YCbCr color',
+    'LAB': 'LAB color',
+    'HSV': 'HSV color',
+    'I': '32-bit integer pixels',
+    'F': '32-bit floating point pixels',
+}
+
+
+# ============================================================================
+# Header-only readers
+# ============================================================================
+#
+# Width, height and color mode live in the first few hundred bytes of a PNG
+# or JPEG. Reading them directly (like the `imagesize` package does) avoids
+# building a Pillow Image object at all. Pillow is only needed when a file
+# carries extra metadata that we report (EXIF, Adobe color info, animation).
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_JPEG_SIGNATURE = b'\xff\xd8\xff'
+
+# Signatures as little-endian integers: the first 8 header bytes are loaded
+# as one uint64 and identified with a dict probe (PNG's signature is exactly
+# 8 bytes) or a 24-bit mask (JPEG's is 3 bytes)
+_SIG_TABLE = {int.from_bytes(_PNG_SIGNATURE, 'little'): 'PNG'}
+_JPEG_SIG_U24 = int.from_bytes(_JPEG_SIGNATURE, 'little')
+
+# PNG IHDR (bit depth, color type) -> Pillow mode name
+_PNG_MODES = {
+    (1, 0): '1', (2, 0): 'L', (4, 0): 'L', (8, 0): 'L',
+    (8, 2): 'RGB', (16, 2): 'RGB',
+    (1, 3): 'P', (2, 3): 'P', (4, 3): 'P', (8, 3): 'P',
+    (8, 4): 'LA', (16, 4): 'LA',
+    (8, 6): 'RGBA', (16, 6): 'RGBA',
+}
+
+# JPEG component count -> Pillow mode name
+_JPEG_MODES = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+
+# Start-of-frame markers carry the dimensions; C4 (DHT), C8 (JPG) and
+# CC (DAC) share the range but are not frames
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_JPEG_PROGRESSIVE_MARKERS = frozenset({0xC2, 0xC6, 0xCA, 0xCE})
+
+# Pre-compiled big-endian unpackers (format string parsed once, bound
+# method looked up once): PNG IHDR width/height, PNG chunk header,
+# JPEG 16-bit length and SOFn frame header
+_PNG_WH = struct.Struct('>II').unpack_from
+_PNG_CHUNK = struct.Struct('>I4s').unpack_from
+_U16 = struct.Struct('>H').unpack_from
+_U32 = struct.Struct('>I').unpack_from
+_U64_LE = struct.Struct('<Q').unpack_from
+_JPEG_FRAME = struct.Struct('>BHHB').unpack_from
+
+# What the header readers scan: the cached leading bytes, or an mmap of
+# the whole file when the header runs past them
+ImageBuffer = Union[bytes, mmap.mmap]
+
+# Stop walking PNG chunks / JPEG segments after this many (corrupt files)
+_MAX_HEADER_SEGMENTS = 64
+
+# Bytes cached from the start of each file - enough for the signature and,
+# for typical files, every PNG chunk / JPEG segment before the image data
+_SNIFF_BYTES = 4096
+
+
+@lru_cache(maxsize=1)
+def _get_pil():
+    """
+    Import Pillow's Image module the first time it is needed.
+
+    Educational Note:
+    Importing PIL.Image and registering its format plugins takes tens of
+    milliseconds - paid by every process that imports data_alchemist,
+    even if it never opens an image. Deferring the import to the first
+    file that actually needs Pillow removes that from start-up, and
+    preinit() registers the common plugins (PNG, JPEG, ...) once so the
+    first Image.open() does not pay for it. The cache makes every later
+    call a dictionary lookup.
+
+    Returns:
+        The PIL.Image module
+    """
+    from PIL import Image
+    Image.preinit()
+    return Image
+
+
+@lru_cache(maxsize=256)
+def _sniff_cached(path_str: str, mtime_ns: int, size: int) -> bytes:
+    """Read the first _SNIFF_BYTES of a file (cached per path/mtime/size)."""
+    # One raw read(2) on a file descriptor - no buffered file object
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        return os.read(fd, _SNIFF_BYTES)
+    finally:
+        os.close(fd)
+
+
+def _sniff(file_path: Path, st: Optional[os.stat_result] = None) -> bytes:
+    """
+    Return the leading bytes of an image file, reading it at most once.
+
+    Educational Note:
+    can_parse() and parse() both need the file header. The bytes are
+    cached by (path, mtime, size) from one os.stat() call, so the usual
+    can_parse-then-parse sequence opens the file once instead of two or
+    three times, and an edited file is automatically re-read. parse()
+    passes in the stat result it already has, so no second stat is made.
+    """
+    if st is None:
+        st = os.stat(file_path)
+    return _sniff_cached(os.fspath(file_path), st.st_mtime_ns, st.st_size)
+
+
+def _read_png_header(buf: ImageBuffer) -> Optional[Dict[str, Any]]:
+    """
+    Read PNG dimensions and mode from the IHDR chunk.
+
+    Educational Note:
+    IHDR is always the first chunk: width and height are big-endian
+    uint32 values at bytes 16-23, followed by bit depth, color type and
+    (byte 28) the interlace flag. The remaining chunks before image data
+    (IDAT) are then walked by their 8-byte headers. gAMA and sRGB are
+    tiny and decoded here; the other ancillary chunks (pHYs, tEXt,
+    iCCP, ...) only carry values that are not reported (see _INFO_KEYS)
+    and are skipped. An animated PNG (acTL) is left to Pillow.
+    """
+    if len(buf) < 29 or buf[12:16] != b'IHDR':
+        return None
+
+    width, height = _PNG_WH(buf, 16)
+    mode = _PNG_MODES.get((buf[24], buf[25]))
+
+    # Same values Pillow puts in img.info for these chunks
+    info: Dict[str, Any] = {}
+    if buf[28]:
+        info['interlace'] = 1
+
+    needs_pillow = mode is None
+    end = len(buf)
+    pos = 33  # signature + IHDR chunk (8 + 4 + 4 + 13 + 4 CRC)
+    for _ in range(_MAX_HEADER_SEGMENTS):
+        if needs_pillow:
+            break
+        if pos + 8 > end:
+            return None
+        length, chunk_type = _PNG_CHUNK(buf, pos)
+        data = pos + 8
+        pos = data + length + 4  # chunk data + CRC
+        if chunk_type in (b'IDAT', b'IEND'):
+            break
+        if chunk_type == b'gAMA' and length == 4:
+            if data + 4 > end:
+                return None
+            info['gamma'] = _U32(buf, data)[0] / 100000.0
+        elif chunk_type == b'sRGB' and length == 1:
+            if data >= end:
+                return None
+            info['srgb'] = buf[data]
+        else:
+            needs_pillow = chunk_type == b'acTL'
+    else:
+        needs_pillow = True
+
+    return {
+        'format': 'PNG',
+        'width': width,
+        'height': height,
+        'mode': mode,
+        'info': info,
+        'exif': None,
+        'needs_pillow': needs_pillow,
+    }
+
+
+def _read_jpeg_header(buf: ImageBuffer) -> Optional[Dict[str, Any]]:
+    """
+    Read JPEG dimensions and mode from the start-of-frame (SOFn) segment.
+
+    Educational Note:
+    A JPEG is a sequence of segments, each starting with a 0xFF marker
+    byte and (for most markers) a big-endian 2-byte length. We hop from
+    segment to segment until a SOFn marker, whose payload is precision
+    (1 byte), height (2), width (2) and component count (1).
+
+    The hops are plain integer offsets into the buffer: marker bytes are
+    indexed directly and lengths/frame fields are decoded in place with
+    pre-bound struct unpackers, so skipping a segment is one addition
+    rather than a read() or seek() call.
+
+    A plain JFIF APP0 segment is decoded here and an EXIF APP1 segment is
+    kept as raw bytes for _parse_exif(). Adobe (APP14) color information,
+    multi-picture (MPF) files and other APP0 variants are left to Pillow;
+    the remaining APPn segments (ICC profiles, XMP) and comments carry
+    nothing we report and are skipped.
+    """
+    info: Dict[str, Any] = {}
+    exif: Optional[bytes] = None
+    needs_pillow = False
+
+    end = len(buf)
+    pos = 2
+    for _ in range(_MAX_HEADER_SEGMENTS):
+        if pos + 2 > end or buf[pos] != 0xFF:
+            return None
+        code = buf[pos + 1]
+        pos += 2
+        while code == 0xFF:  # fill bytes before a marker
+            if pos >= end:
+                return None
+            code = buf[pos]
+            pos += 1
+        if code == 0x01 or 0xD0 <= code <= 0xD8:
+            continue  # standalone markers carry no length
+        if code == 0xDA:
+            return None  # scan data before any frame header
+
+        if pos + 2 > end:
+            return None
+        (length,) = _U16(buf, pos)
+        body = pos + 2
+        pos += length  # next marker (length includes its own 2 bytes)
+
+        if code in _JPEG_SOF_MARKERS:
+            if body + 6 > end:
+                return None
+            _, height, width, components = _JPEG_FRAME(buf, body)
+            mode = _JPEG_MODES.get(components)
+            if code in _JPEG_PROGRESSIVE_MARKERS:
+                info['progressive'] = info['progression'] = 1
+            return {
+                'format': 'JPEG',
+                'width': width,
+                'height': height,
+                'mode': mode,
+                'info': info,
+                'exif': exif,
+                'needs_pillow': needs_pillow or mode is None,
+            }
+
+        if code == 0xE0:
+            if buf[body:body + 5] == b'JFIF\x00' and body + 8 <= min(pos, end):
+                # Same scalar fields Pillow reports for JFIF
+                info['jfif'] = _U16(buf, body + 5)[0]
+                info['jfif_unit'] = buf[body + 7]
+            else:
+                needs_pillow = True
+        elif code == 0xE1:
+            if exif is None and buf[body:body + 6] == b'Exif\x00\x00':
+                exif = bytes(buf[body:pos])
+        elif code == 0xEE or (code == 0xE2 and buf[body:body + 4] == b'MPF\x00'):
+            needs_pillow = True
+            break
+
+    return None
+
+
+def _prefetch_headers(file_paths: List[Path]) -> None:
+    """
+    Ask the kernel to start reading every file's header in the background.
+
+    Educational Note:
+    Reading headers one file at a time leaves a fast SSD mostly idle: each
+    read waits for the previous one. posix_fadvise(POSIX_FADV_WILLNEED)
+    returns immediately and queues asynchronous readahead, so the reads for
+    the whole batch are in flight together. By the time a worker sniffs a
+    file its header is usually already in the page cache. This is the
+    portable, dependency-free cousin of batched io_uring submission.
+    On platforms without posix_fadvise this is a no-op.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    for path in file_paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue  # parse() reports missing/unreadable files
+        try:
+            os.posix_fadvise(fd, 0, _SNIFF_BYTES, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _signature_format(header: bytes) -> Optional[str]:
+    """
+    Identify an image format from its first 8 bytes ('PNG', 'JPEG' or None).
+
+    Educational Note:
+    Instead of comparing byte slices one signature at a time, the 8 bytes
+    are loaded once as an unsigned 64-bit integer. PNG is then a single
+    dict lookup and JPEG a single mask-and-compare. can_parse(), the
+    header readers and the fallback parser all share this one table.
+    """
+    if len(header) < 8:
+        return None
+    (signature,) = _U64_LE(header)
+    return _SIG_TABLE.get(signature) or (
+        'JPEG' if signature & 0xFFFFFF == _JPEG_SIG_U24 else None
+    )
+
+
+# Signature format -> header reader; each reader handles only its own
+# format's layout (no EXIF probing for PNG, no chunk walk for JPEG)
+_HEADER_READERS = {
+    'PNG': _read_png_header,
+    'JPEG': _read_jpeg_header,
+}
+
+
+def _parse_header(buf: ImageBuffer) -> Optional[Dict[str, Any]]:
+    """
+    Dispatch to the PNG or JPEG header reader by file signature.
+
+    Educational Note:
+    A dispatch table replaces an if/elif chain: the format found by
+    _signature_format() selects the specialized reader with one dict
+    lookup, and supporting another format means adding one entry.
+    """
+    reader = _HEADER_READERS.get(_signature_format(buf))
+    return reader(buf) if reader is not None else None
+
+
+def _read_image_header(
+    file_path: Path,
+    st: Optional[os.stat_result] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Read format, dimensions and mode from an image header without Pillow.
+
+    The cached leading bytes from _sniff() are parsed first; the file is
+    only reopened when the header runs past them (e.g. a large EXIF block).
+    That reopen memory-maps the file and the same readers walk the mapping
+    by offset, so the OS pages in only the parts actually read.
+
+    Args:
+        file_path: Path to image file
+        st: os.stat() result for file_path, if the caller already has one
+
+    Returns:
+        Dict with format/width/height/mode/info/needs_pillow, or None
+        if the header could not be understood (Pillow should decide)
+    """
+    header = _sniff(file_path, st)
+    result = _parse_header(header)
+    if result is None and len(header) == _SNIFF_BYTES:
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                result = _parse_header(mm)
+    return result
+
+
+# ============================================================================
+# EXIF reader
+# ============================================================================
+
+# Tags decoded from the EXIF block, by IFD. Everything else is skipped
+# without reading its value. Names match Pillow's ExifTags.
+_EXIF_IFD0_TAGS = {
+    0x010F: 'Make',
+    0x0110: 'Model',
+    0x0112: 'Orientation',
+    0x0131: 'Software',
+    0x0132: 'DateTime',
+}
+_EXIF_SUBIFD_TAGS = {
+    0x829A: 'ExposureTime',
+    0x829D: 'FNumber',
+    0x8827: 'ISOSpeedRatings',
+    0x9003: 'DateTimeOriginal',
+    0x920A: 'FocalLength',
+}
+_EXIF_GPS_TAGS = {
+    0x0000: 'GPSVersionID',
+    0x0001: 'GPSLatitudeRef',
+    0x0002: 'GPSLatitude',
+    0x0003: 'GPSLongitudeRef',
+    0x0004: 'GPSLongitude',
+    0x0005: 'GPSAltitudeRef',
+    0x0006: 'GPSAltitude',
+}
+_EXIF_SUBIFD_POINTER = 0x8769
+_EXIF_GPS_POINTER = 0x8825
+
+# TIFF field type -> (struct code, size in bytes). 7 (UNDEFINED) is absent
+# on purpose: opaque bytes are skipped, never decoded.
+_EXIF_TYPES = {
+    1: ('B', 1),   # BYTE
+    2: ('s', 1),   # ASCII
+    3: ('H', 2),   # SHORT
+    4: ('I', 4),   # LONG
+    5: ('II', 8),  # RATIONAL
+    9: ('i', 4),   # SLONG
+    10: ('ii', 8), # SRATIONAL
+}
+
+
+def _exif_value(tiff: bytes, order: str, field_type: int, count: int,
+                value_offset: int) -> Any:
+    """Decode one IFD entry value; None for unsupported or truncated data."""
+    spec = _EXIF_TYPES.get(field_type)
+    if spec is None:
+        return None
+    code, size = spec
+    total = size * count
+    if total > 4:
+        # Value stored elsewhere; the 4 entry bytes hold its offset
+        value_offset = struct.unpack_from(order + 'I', tiff, value_offset)[0]
+    if value_offset + total > len(tiff):
+        return None
+
+    if field_type == 2:
+        raw = tiff[value_offset:value_offset + count]
+        return raw.split(b'\x00', 1)[0].decode('utf-8', 'replace').strip()
+
+    values = struct.unpack_from(f'{order}{count * len(code)}{code[0]}', tiff, value_offset)
+    if field_type in (5, 10):
+        # Rationals as floats (numerator / denominator pairs)
+        values = tuple(
+            num / den if den else 0.0
+            for num, den in zip(values[::2], values[1::2])
+        )
+    return values[0] if count == 1 else list(values)
+
+
+def _read_ifd(tiff: bytes, order: str, offset: int,
+              tags: Dict[int, str], out: Dict[str, Any]) -> Dict[int, int]:
+    """
+    Decode whitelisted tags of one IFD into out.
+
+    Returns:
+        Offsets of the Exif and GPS sub-IFDs found in this IFD
+    """
+    pointers: Dict[int, int] = {}
+    if offset + 2 > len(tiff):
+        return pointers
+    (entry_count,) = struct.unpack_from(order + 'H', tiff, offset)
+    for i in range(min(entry_count, 512)):
+        entry = offset + 2 + 12 * i
+        if entry + 12 > len(tiff):
+            break
+        tag, field_type, count = struct.unpack_from(order + 'HHI', tiff, entry)
+        if tag in (_EXIF_SUBIFD_POINTER, _EXIF_GPS_POINTER):
+            pointers[tag] = struct.unpack_from(order + 'I', tiff, entry + 8)[0]
+            continue
+        name = tags.get(tag)
+        if name is None:
+            continue
+        value = _exif_value(tiff, order, field_type, count, entry + 8)
+        if value is not None:
+            out[name] = value
+    return pointers
+
+
+def _parse_exif(exif: Optional[bytes]) -> Dict[str, Any]:
+    """
+    Decode selected EXIF tags from a raw APP1 EXIF block.
+
+    Educational Note:
+    EXIF data is a small TIFF file: a byte-order mark ('II' little-endian
+    or 'MM' big-endian), then IFDs (tables of 12-byte entries: tag, type,
+    count, value-or-offset). Camera settings live in a sub-IFD and GPS
+    data in another, both referenced from the first IFD. Walking these
+    tables directly lets us decode only the handful of tags we report
+    instead of materializing every tag (including maker notes and
+    thumbnails) as Python objects.
+
+    Args:
+        exif: APP1 payload starting with b'Exif\\0\\0', or None
+
+    Returns:
+        Dictionary of EXIF fields ('GPSInfo' holds a nested dict)
+    """
+    if not exif or exif[:6] != b'Exif\x00\x00':
+        return {}
+
+    tiff = exif[6:]
+    if tiff[:4] == b'II*\x00':
+        order = '<'
+    elif tiff[:4] == b'MM\x00*':
+        order = '>'
+    else:
+        return {}
+
+    exif_data: Dict[str, Any] = {}
+    try:
+        (ifd0,) = struct.unpack_from(order + 'I', tiff, 4)
+        pointers = _read_ifd(tiff, order, ifd0, _EXIF_IFD0_TAGS, exif_data)
+        if _EXIF_SUBIFD_POINTER in pointers:
+            _read_ifd(tiff, order, pointers[_EXIF_SUBIFD_POINTER],
+                      _EXIF_SUBIFD_TAGS, exif_data)
+        if _EXIF_GPS_POINTER in pointers:
+            gps: Dict[str, Any] = {}
+            _read_ifd(tiff, order, pointers[_EXIF_GPS_POINTER], _EXIF_GPS_TAGS, gps)
+            if gps:
+                exif_data['GPSInfo'] = gps
+    except struct.error as e:
+        logger.warning("Error extracting EXIF data: %s", e)
+
+    return exif_data
+
+
+class ParseFlags(IntFlag):
+    """
+    Which parts of an image's metadata ImageParser.parse() extracts.
+
+    Educational Note:
+    Dimensions come straight from the header and are always reported.
+    The other parts cost extra work - EXIF decoding, the color mode
+    lookup, the format-info walk, and for some files opening the image
+    with Pillow at all - so a caller that only needs sizes can skip them:
+
+        parser.parse(path, flags=ParseFlags.DIMS)
+
+    Flags combine with |, e.g. ParseFlags.DIMS | ParseFlags.EXIF.
+    """
+    DIMS = 1   # width, height, format, megapixels, aspect ratio
+    EXIF = 2   # data['exif'] (JPEG)
+    MODE = 4   # mode, mode_description, has_transparency
+    INFO = 8   # metadata['image_info']
+    ALL = DIMS | EXIF | MODE | INFO
+
+
+# ============================================================================
+# Process-pool workers (module level so they can be pickled)
+# ============================================================================
+
+_WORKER_PARSER = None
+
+
+def _init_worker() -> None:
+    """Create one ImageParser per worker process (reused for every file)."""
+    global _WORKER_PARSER
+    _WORKER_PARSER = ImageParser()
+
+
+def _parse_in_worker(
+    file_path: Path,
+    flags: ParseFlags = ParseFlags.ALL
+) -> IntermediateData:
+    """Parse one image with the worker process's parser."""
+    return _WORKER_PARSER.parse(file_path, flags)
+
+
 class ImageParser(BaseParser):
     """
     Parser plugin for image files (PNG, JPEG, and more).
@@ -123,37 +698,36 @@ class ImageParser(BaseParser):
 
         # Check extension first (fast check)
         ext = file_path.suffix.lower()
-        if ext not in self.supported_formats:
-            logger.debug(f"ImageParser cannot parse {file_path} (unsupported extension: {ext})")
+        if ext not in _SUPPORTED_FORMATS:
+            logger.debug("ImageParser cannot parse %s (unsupported extension: %s)", file_path, ext)
             return False
 
-        # Validate image header signature
+        # Validate image header signature (cached for the parse() call)
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(16)
+            header = _sniff(file_path)
 
-            if len(header) < 4:
-                logger.debug(f"ImageParser cannot parse {file_path} (file too small)")
+            if len(header) < 8:
+                logger.debug("ImageParser cannot parse %s (file too small)", file_path)
                 return False
 
-            # Check for PNG signature
-            if header[:8] == b'\x89PNG\r\n\x1a\n':
-                logger.debug(f"ImageParser can parse {file_path} (PNG signature)")
-                return True
-
-            # Check for JPEG signature
-            if header[:3] == b'\xff\xd8\xff':
-                logger.debug(f"ImageParser can parse {file_path} (JPEG signature)")
+            # Check for PNG/JPEG signature
+            fmt = _signature_format(header)
+            if fmt is not None:
+                logger.debug("ImageParser can parse %s (%s signature)", file_path, fmt)
                 return True
 
-            logger.debug(f"ImageParser cannot parse {file_path} (invalid image signature)")
+            logger.debug("ImageParser cannot parse %s (invalid image signature)", file_path)
             return False
 
         except IOError as e:
-            logger.debug(f"ImageParser cannot read file {file_path}: {e}")
+            logger.debug("ImageParser cannot read file %s: %s", file_path, e)
             return False
 
-    def parse(self, file_path: Path) -> IntermediateData:
+    def parse(
+        self,
+        file_path: Path,
+        flags: ParseFlags = ParseFlags.ALL
+    ) -> IntermediateData:
         """
         Parse image file into intermediate representation.
 
@@ -167,10 +741,13 @@ class ImageParser(BaseParser):
         6. Create intermediate representation
 
         We extract metadata WITHOUT loading the full pixel data,
-        making this memory-efficient for large images.
+        making this memory-efficient for large images. Passing flags
+        skips the parts a caller does not need (see ParseFlags).
 
         Args:
             file_path: Path to image file to parse
+            flags: Which metadata to extract (default: everything);
+                fields for unrequested parts are omitted from the result
 
         Returns:
             IntermediateData containing:
@@ -197,33 +774,110 @@ class ImageParser(BaseParser):
         if not isinstance(file_path, Path):
             file_path = Path(file_path)
 
-        logger.info(f"Parsing image file: {file_path}")
+        logger.info("Parsing image file: %s", file_path)
 
         # Phase 4: Comprehensive validation with resource checks
-        try:
-            validation_result = validate_file_for_parsing(
-                file_path,
-                file_type=file_path.suffix.lstrip('.').lower(),
-                max_size=None  # Use default limit
-            )
-            logger.debug(f"Validation passed: {validation_result['file_size']:,} bytes")
-        except Exception as e:
-            raise ParserError(f"File validation failed: {e}")
+        st = self._validate(file_path)
+        logger.debug("Validation passed: %d bytes", st.st_size)
 
         # Phase 4: Parse with timeout protection
         try:
             with timeout(DEFAULT_PARSE_TIMEOUT, "Image parsing"):
                 if PILLOW_AVAILABLE:
-                    return self._parse_with_pillow(file_path)
+                    return self._parse_with_pillow(file_path, st, flags)
                 else:
-                    return self._parse_fallback(file_path)
+                    return self._parse_fallback(file_path, st, flags)
         except Exception as e:
             # Re-raise ParserError as-is, wrap others
             if isinstance(e, ParserError):
                 raise
             raise ParserError(f"Image parsing failed: {e}")
 
-    def _parse_with_pillow(self, file_path: Path) -> IntermediateData:
+    def _validate(self, file_path: Path) -> os.stat_result:
+        """
+        Run validate_file_for_parsing() and return the stat result it used.
+
+        Validation makes a single stat() call; its result is reused for
+        the header cache key and the reported file size.
+
+        Raises:
+            ParserError: If the file fails validation
+        """
+        try:
+            validation_result = validate_file_for_parsing(
+                file_path,
+                file_type=file_path.suffix.lstrip('.').lower(),
+                max_size=MAX_IMAGE_FILE_SIZE
+            )
+        except Exception as e:
+            raise ParserError(f"File validation failed: {e}")
+        return validation_result['stat_result']
+
+    def parse_many(
+        self,
+        file_paths: List[Path],
+        max_workers: Optional[int] = None,
+        flags: ParseFlags = ParseFlags.ALL
+    ) -> List[IntermediateData]:
+        """
+        Parse many images in parallel using a pool of worker processes.
+
+        Educational Note:
+        Reading image headers is dominated by per-file latency (stat, open,
+        read), and the Pillow path holds the GIL while it parses. Separate
+        processes overlap that work on every core, and header readahead for
+        the whole batch is queued with the kernel first (_prefetch_headers).
+        Each worker validates and sniffs its own files - the parent does no
+        per-file work, so nothing is read twice and a bad file only fails
+        its own job. Each worker builds one ImageParser up front (pool
+        initializer) and paths are sent in chunks of several files, so
+        process start-up and pickling are paid per chunk rather than per
+        image.
+
+        Args:
+            file_paths: Image files to parse
+            max_workers: Process count (defaults to os.cpu_count())
+            flags: Which metadata to extract for every file (see parse())
+
+        Returns:
+            One IntermediateData per input file, in input order
+
+        Raises:
+            ParserError: If any file fails validation or parsing (the
+                first failure in input order is raised)
+
+        Example:
+            >>> parser = ImageParser()
+            >>> results = parser.parse_many(sorted(Path('photos').glob('*.jpg')))
+            >>> [r.data['width'] for r in results]
+            [4032, 4032, 3024]
+        """
+        file_paths = [Path(p) for p in file_paths]
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+
+        # Not worth starting processes for a single file or worker
+        if workers <= 1:
+            return [self.parse(path, flags) for path in file_paths]
+
+        # Queue readahead for every header before the workers start
+        _prefetch_headers(file_paths)
+
+        chunksize = max(1, len(file_paths) // (4 * workers))
+        logger.info(
+            f"Parsing {len(file_paths)} images with {workers} processes "
+            f"(chunksize={chunksize})"
+        )
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            parse_one = partial(_parse_in_worker, flags=flags)
+            return list(executor.map(parse_one, file_paths, chunksize=chunksize))
+
+    def _parse_with_pillow(
+        self,
+        file_path: Path,
+        st: os.stat_result,
+        flags: ParseFlags = ParseFlags.ALL
+    ) -> IntermediateData:
         """
         Parse image file using Pillow (preferred method).
 
@@ -235,15 +889,54 @@ class ImageParser(BaseParser):
         - Format validation
         - Efficient loading
 
+        Most of that is only needed for files with extra metadata. The
+        image header is read directly first (_read_image_header); Pillow
+        opens the file only when the header shows EXIF or other metadata
+        it alone decodes, or could not be understood. For plain PNG/JPEG files this skips the
+        Pillow Image object entirely - and so does a dimensions-only
+        request (flags=ParseFlags.DIMS), since the header always has them.
+
         Args:
             file_path: Path to image file
+            st: os.stat() result for file_path (from parse())
+            flags: Which metadata to extract (see ParseFlags)
 
         Returns:
             IntermediateData with image metadata
         """
+        # Fast path: dimensions and mode straight from the header bytes
+        try:
+            header = _read_image_header(file_path, st)
+        except (OSError, ValueError):
+            # Unreadable or truncated header (mmap seeks past the end raise
+            # ValueError) - let Pillow produce the error message
+            header = None
+
+        if header is not None and (
+            not header['needs_pillow'] or flags == ParseFlags.DIMS
+        ):
+            logger.info(
+                "Image header read: %dx%d, format: %s, mode: %s",
+                header['width'], header['height'], header['format'], header['mode']
+            )
+            return self._build_intermediate(
+                file_path,
+                st.st_size,
+                header['width'],
+                header['height'],
+                header['format'],
+                header['mode'],
+                header['info'],
+                exif_data=(
+                    self._extract_exif(header['exif'])
+                    if flags & ParseFlags.EXIF else None
+                ),
+                flags=flags
+            )
+
         try:
             # Open image (this validates format but doesn't load all pixel data)
-            img = Image.open(file_path)
+            img = _get_pil().open(file_path)
 
             # Extract basic metadata
             width, height = img.size
@@ -251,8 +944,8 @@ class ImageParser(BaseParser):
             img_mode = img.mode      # e.g., 'RGB', 'RGBA', 'L'
 
             logger.info(
-                f"Image loaded: {width}x{height}, "
-                f"format: {img_format}, mode: {img_mode}"
+                "Image loaded: %dx%d, format: %s, mode: %s",
+                width, height, img_format, img_mode
             )
 
         except IOError as e:
@@ -267,107 +960,134 @@ class ImageParser(BaseParser):
                 f"Error: {e}"
             )
 
-        # Calculate derived metrics
-        megapixels = (width * height) / 1_000_000
-        aspect_ratio = width / height if height > 0 else 0
-
-        # Get color mode description
-        mode_descriptions = {
-            '1': '1-bit black and white',
-            'L': '8-bit grayscale',
-            'P': '8-bit palette',
-            'RGB': '24-bit true color (RGB)',
-            'RGBA': '32-bit true color with alpha (RGBA)',
-            'CMYK': 'CMYK color',
-            'YCbCr': 'YCbCr color',
-            'LAB': 'LAB color',
-            'HSV': 'HSV color',
-            'I': '32-bit integer pixels',
-            'F': '32-bit floating point pixels',
-        }
-        mode_description = mode_descriptions.get(img_mode, img_mode)
-
-        # Extract EXIF data for JPEG files
-        exif_data = None
-        if img_format == 'JPEG':
-            exif_data = self._extract_exif(img)
+        try:
+            # Extract EXIF data for JPEG files
+            exif_data = None
+            if img_format == 'JPEG' and flags & ParseFlags.EXIF:
+                exif_data = self._extract_exif(img.info.get('exif'))
+            info = img.info if hasattr(img, 'info') else {}
+        finally:
+            # Close image to free resources
+            img.close()
+
+        return self._build_intermediate(
+            file_path, st.st_size, width, height, img_format, img_mode,
+            info, exif_data, flags
+        )
 
-        # Get file size
-        file_size_bytes = file_path.stat().st_size
+    def _build_intermediate(
+        self,
+        file_path: Path,
+        file_size_bytes: int,
+        width: int,
+        height: int,
+        img_format: str,
+        img_mode: str,
+        info: Dict[str, Any],
+        exif_data: Optional[Dict[str, Any]],
+        flags: ParseFlags = ParseFlags.ALL
+    ) -> IntermediateData:
+        """
+        Build IntermediateData from image properties.
 
-        # Determine if image has transparency
-        has_transparency = img_mode in ('RGBA', 'LA', 'P') or (
-            img_mode == 'P' and 'transparency' in img.info
-        )
+        Shared by the header-only path and the Pillow path so both report
+        exactly the same fields, metadata and warnings. The data, metadata
+        and warnings are assembled locally and handed to IntermediateData
+        in one constructor call rather than added entry by entry.
 
-        # Create intermediate data
-        intermediate = IntermediateData(
-            source_file=str(file_path),
-            file_type=img_format.lower() if img_format else 'image'
-        )
+        Args:
+            file_path: Path to image file
+            file_size_bytes: File size from the caller's os.stat() result
+            width: Image width in pixels
+            height: Image height in pixels
+            img_format: Format name (e.g. 'PNG', 'JPEG')
+            img_mode: Color mode (e.g. 'RGB', 'L')
+            info: Format-specific info (Pillow's img.info)
+            exif_data: Extracted EXIF fields, if any
+            flags: Which fields to report (see ParseFlags)
 
-        # Store parsed data
-        intermediate.data = {
+        Returns:
+            IntermediateData with image metadata
+        """
+        # Calculate derived metrics, rounded (half up) with integer math:
+        # megapixels to 2 places, aspect ratio to 3
+        pixels = width * height
+        megapixels = (pixels + 5_000) // 10_000 / 100
+        aspect_ratio = (width * 2_000 // height + 1) // 2 / 1000 if height > 0 else 0
+
+        # Store parsed data (one dict literal, other parts only if requested)
+        data = {
             'width': width,
             'height': height,
             'format': img_format,
-            'mode': img_mode,
-            'mode_description': mode_description,
-            'megapixels': round(megapixels, 2),
-            'aspect_ratio': round(aspect_ratio, 3),
-            'has_transparency': has_transparency,
+            'megapixels': megapixels,
+            'aspect_ratio': aspect_ratio,
         }
 
-        # Add EXIF data if available
+        if flags & ParseFlags.MODE:
+            data['mode'] = img_mode
+            # Get color mode description
+            data['mode_description'] = _MODE_DESCRIPTIONS.get(img_mode, img_mode)
+            # Determine if image has transparency
+            data['has_transparency'] = img_mode in ('RGBA', 'LA', 'P') or (
+                img_mode == 'P' and 'transparency' in info
+            )
+
         if exif_data:
-            intermediate.data['exif'] = exif_data
+            data['exif'] = exif_data
 
-        # Add metadata
-        intermediate.add_metadata('file_size_bytes', file_size_bytes)
-        intermediate.add_metadata('file_size_kb', round(file_size_bytes / 1024, 2))
+        metadata = {
+            'file_size_bytes': file_size_bytes,
+            'file_size_kb': round(file_size_bytes / 1024, 2),
+        }
 
-        # Get additional image info
-        if hasattr(img, 'info') and img.info:
-            # Filter out binary data from info
+        # Get additional image info (whitelisted scalar keys only)
+        if flags & ParseFlags.INFO:
             filtered_info = {
-                k: v for k, v in img.info.items()
-                if isinstance(v, (str, int, float, bool))
+                k: info[k] for k in _INFO_KEYS
+                if k in info and isinstance(info[k], (str, int, float, bool))
             }
             if filtered_info:
-                intermediate.add_metadata('image_info', filtered_info)
-
-        # Add warnings for unusual configurations
-        if megapixels > 50:
-            intermediate.add_warning(
-                f"Very large image: {megapixels:.1f} megapixels "
+                metadata['image_info'] = filtered_info
+
+        # Collect warnings for unusual configurations (thresholds compared
+        # on the exact integers, not the rounded values)
+        warnings = []
+        if pixels > 50_000_000:
+            warnings.append(
+                f"Very large image: {pixels / 1_000_000:.1f} megapixels "
                 f"({width}x{height})"
             )
 
         if width < 10 or height < 10:
-            intermediate.add_warning(
-                f"Very small image: {width}x{height} pixels"
-            )
+            warnings.append(f"Very small image: {width}x{height} pixels")
 
         # Warn about unusual aspect ratios
-        if aspect_ratio > 10 or (aspect_ratio < 0.1 and aspect_ratio > 0):
-            intermediate.add_warning(
+        if width > 10 * height or 0 < 10 * width < height:
+            warnings.append(
                 f"Unusual aspect ratio: {aspect_ratio:.3f} "
                 f"(very wide or very tall image)"
             )
 
-        logger.info(
-            f"Image parsing complete: {width}x{height} {img_format} "
-            f"({megapixels:.2f} MP)"
+        # Create intermediate data with every field in one constructor call
+        intermediate = IntermediateData(
+            source_file=str(file_path),
+            file_type=img_format.lower() if img_format else 'image',
+            data=data,
+            metadata=metadata,
+            warnings=warnings
         )
 
-        # Close image to free resources
-        img.close()
+        logger.info(
+            "Image parsing complete: %dx%d %s (%.2f MP)",
+            width, height, img_format, megapixels
+        )
 
         return intermediate
 
-    def _extract_exif(self, img: 'Image.Image') -> Dict[str, Any]:
+    def _extract_exif(self, exif: Optional[bytes]) -> Dict[str, Any]:
         """
-        Extract EXIF metadata from image.
+        Extract EXIF metadata from a raw EXIF block.
 
         Educational Note:
         EXIF (Exchangeable Image File Format) contains metadata about:
@@ -378,56 +1098,30 @@ class ImageParser(BaseParser):
         - Image orientation
         - Software used
 
-        This is primarily found in JPEG files from digital cameras.
+        This is primarily found in JPEG files from digital cameras. The
+        block comes from the header reader or Pillow's img.info['exif'];
+        either way it is decoded by _parse_exif(), which reads only the
+        tags listed in _EXIF_IFD0_TAGS, _EXIF_SUBIFD_TAGS and _EXIF_GPS_TAGS.
 
         Args:
-            img: Pillow Image object
+            exif: Raw APP1 EXIF payload, or None
 
         Returns:
             Dictionary of EXIF data with human-readable keys
         """
-        exif_data = {}
-
-        try:
-            # Get EXIF data
-            exif = img._getexif()
-
-            if exif is None:
-                logger.debug("No EXIF data found in image")
-                return exif_data
-
-            # Convert EXIF tag numbers to human-readable names
-            for tag_id, value in exif.items():
-                # Get tag name
-                tag_name = ExifTags.TAGS.get(tag_id, str(tag_id))
-
-                # Convert value to JSON-serializable format
-                if isinstance(value, bytes):
-                    # Skip binary data
-                    continue
-                elif isinstance(value, (tuple, list)):
-                    # Convert to list of primitives
-                    value = [
-                        str(v) if not isinstance(v, (int, float, str, bool)) else v
-                        for v in value
-                    ]
-                elif not isinstance(value, (int, float, str, bool, dict, list)):
-                    # Convert complex types to string
-                    value = str(value)
-
-                exif_data[tag_name] = value
-
-            logger.debug(f"Extracted {len(exif_data)} EXIF fields")
-
-        except AttributeError:
-            # Image doesn't have _getexif method
-            logger.debug("Image format doesn't support EXIF")
-        except Exception as e:
-            logger.warning(f"Error extracting EXIF data: {e}")
-
+        exif_data = _parse_exif(exif)
+        if exif_data:
+            logger.debug("Extracted %d EXIF fields", len(exif_data))
+        else:
+            logger.debug("No EXIF data found in image")
         return exif_data
 
-    def _parse_fallback(self, file_path: Path) -> IntermediateData:
+    def _parse_fallback(
+        self,
+        file_path: Path,
+        st: os.stat_result,
+        flags: ParseFlags = ParseFlags.ALL
+    ) -> IntermediateData:
         """
         Fallback parser for images without Pillow (very limited functionality).
 
@@ -444,63 +1138,63 @@ class ImageParser(BaseParser):
         - Byte 24: Bit depth
         - Byte 25: Color type
 
-        JPEG is much more complex and harder to parse manually.
+        JPEG has no fixed layout: the segments are walked marker by marker
+        until a start-of-frame (SOFn) segment, which holds height, width
+        and the number of color components (see _read_jpeg_header).
+
+        Both readers (and the EXIF reader) are shared with the Pillow
+        path's header fast path, so only details that need Pillow itself
+        (Adobe color info, animation, unusual color modes) are missing.
 
         Args:
             file_path: Path to image file
+            st: os.stat() result for file_path (from parse())
+            flags: Which metadata to extract (see ParseFlags)
 
         Returns:
-            IntermediateData with very basic image metadata
+            IntermediateData with basic image metadata
         """
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(64)
-
-            # Try PNG
-            if header[:8] == b'\x89PNG\r\n\x1a\n':
-                # Parse PNG IHDR chunk
-                if len(header) >= 24 and header[12:16] == b'IHDR':
-                    width = int.from_bytes(header[16:20], byteorder='big')
-                    height = int.from_bytes(header[20:24], byteorder='big')
-
-                    intermediate = IntermediateData(
-                        source_file=str(file_path),
-                        file_type='png'
-                    )
-                    intermediate.data = {
-                        'width': width,
-                        'height': height,
-                        'format': 'PNG',
-                        'mode': 'unknown',
-                        'megapixels': round((width * height) / 1_000_000, 2),
-                    }
-                    intermediate.add_warning(
-                        "Parsed with fallback method (Pillow not available) - "
-                        "metadata is limited"
-                    )
-                    return intermediate
-
-            # Try JPEG (basic detection only - hard to parse dimensions without library)
-            elif header[:3] == b'\xff\xd8\xff':
-                intermediate = IntermediateData(
-                    source_file=str(file_path),
-                    file_type='jpeg'
+            header = _sniff(file_path, st)
+            if _signature_format(header) is None:
+                raise ParserError(
+                    f"Unsupported image format (fallback parser): {file_path}\n"
+                    f"Tip: Install Pillow for full image support: pip install Pillow"
                 )
-                intermediate.data = {
-                    'format': 'JPEG',
-                    'mode': 'unknown',
-                }
-                intermediate.add_warning(
-                    "Parsed with fallback method (Pillow not available) - "
-                    "dimensions and metadata could not be extracted. "
-                    "Install Pillow for full support: pip install Pillow"
+
+            image_header = _read_image_header(file_path, st)
+            if image_header is None:
+                raise ParserError(
+                    f"Could not read image header (fallback parser): {file_path}\n"
+                    f"Tip: File may be corrupted; install Pillow for better "
+                    f"diagnostics: pip install Pillow"
                 )
-                return intermediate
 
-            raise ParserError(
-                f"Unsupported image format (fallback parser): {file_path}\n"
-                f"Tip: Install Pillow for full image support: pip install Pillow"
+            intermediate = self._build_intermediate(
+                file_path,
+                st.st_size,
+                image_header['width'],
+                image_header['height'],
+                image_header['format'],
+                image_header['mode'] or 'unknown',
+                image_header['info'],
+                exif_data=(
+                    self._extract_exif(image_header['exif'])
+                    if flags & ParseFlags.EXIF else None
+                ),
+                flags=flags
             )
+            intermediate.add_warning(
+                "Parsed with fallback method (Pillow not available) - "
+                "metadata is limited"
+            )
+            if image_header['needs_pillow'] and flags != ParseFlags.DIMS:
+                intermediate.add_warning(
+                    "Image has metadata or a color mode that the "
+                    "fallback cannot decode. "
+                    "Install Pillow for full support: pip install Pillow"
+                )
+            return intermediate
 
         except ParserError:
             raise
@@ -524,7 +1218,7 @@ class ImageParser(BaseParser):
             >>> parser.supported_formats
             ['.png', '.jpg', '.jpeg']
         """
-        return ['.png', '.jpg', '.jpeg']
+        return _SUPPORTED_FORMATS_LIST
 
     @property
     def parser_name(self) -> str:
@@ -14,10 +14,14 @@ Design Pattern: Singleton-like Configuration
 Purpose: Provide consistent logging behavior throughout the application
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 
 # ============================================================================
@@ -40,6 +44,15 @@ LOG_LEVELS = {
     'critical': logging.CRITICAL
 }
 
+# Reverse map (level number -> 'DEBUG', 'INFO', ...) for diagnostic messages
+_LEVEL_NAMES = {value: name.upper() for name, value in LOG_LEVELS.items()}
+
+
+def _level_name(level: int) -> str:
+    """Name of a logging level, without going through logging.getLevelName()."""
+    name = _LEVEL_NAMES.get(level)
+    return name if name is not None else logging.getLevelName(level)
+
 
 # ============================================================================
 # Default Format Strings
@@ -58,6 +71,188 @@ DETAILED_FORMAT = (
 TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 
+def _record_message(record: logging.LogRecord) -> str:
+    """
+    Return record.getMessage(), computed at most once per record.
+
+    With a log file configured every record goes to two handlers
+    (console and file), and each would otherwise merge msg % args again.
+    """
+    try:
+        return record._merged_message
+    except AttributeError:
+        message = record._merged_message = record.getMessage()
+        return message
+
+
+class _CachedMessageFormatter(logging.Formatter):
+    """logging.Formatter that reuses the record's merged message."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        # Same steps as logging.Formatter.format, minus the getMessage() call
+        record.message = _record_message(record)
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        s = self.formatMessage(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + self.formatStack(record.stack_info)
+        return s
+
+
+# The two formatters setup_logging() hands out, built once. A Formatter
+# only reads its settings when formatting, so handlers can share them.
+_SIMPLE_FORMATTER = _CachedMessageFormatter(SIMPLE_FORMAT, TIMESTAMP_FORMAT)
+_DETAILED_FORMATTER = _CachedMessageFormatter(DETAILED_FORMAT, TIMESTAMP_FORMAT)
+
+# Loggers already handed out by get_logger(), by name
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
+# (log file, verbose) of the handlers setup_logging() last installed, and
+# those handlers; a later call with the same destinations reuses them
+_ACTIVE_CONFIG: Optional[Tuple[Optional[str], bool]] = None
+_ACTIVE_HANDLERS: List[logging.Handler] = []
+
+# Log file write buffer; flushed whenever the log queue runs dry
+_FILE_BUFFER_SIZE = 64 * 1024
+
+# Background thread writing queued records to the log file (see setup_logging)
+_QUEUE_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Write out any queued records and close the log file handler."""
+    global _QUEUE_LISTENER, _ACTIVE_CONFIG
+    listener, _QUEUE_LISTENER = _QUEUE_LISTENER, None
+    if listener is not None:
+        _ACTIVE_CONFIG = None  # the installed QueueHandler has no reader now
+        listener.stop()  # drains the queue, then joins the thread
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(_stop_queue_listener)
+
+
+class _BatchingFileHandler(logging.FileHandler):
+    """
+    FileHandler that lets its QueueListener decide when to flush.
+
+    StreamHandler.emit() flushes after every record - one write() syscall
+    per log line. Here emit() only fills the file's 64 KiB buffer, and
+    _BatchingQueueListener calls flush_now() whenever the queue runs dry,
+    so a burst of records becomes one write per 64 KiB (or per burst).
+    """
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=_FILE_BUFFER_SIZE,
+            encoding=self.encoding, errors=getattr(self, 'errors', None)
+        )
+
+    def flush(self) -> None:
+        """Called by emit() after each record; deferred to flush_now()."""
+
+    def flush_now(self) -> None:
+        """Write out buffered records."""
+        super().flush()
+
+    def discard(self) -> None:
+        """
+        Make sure this handler's buffered output is never written.
+
+        Used in a forked child: the buffer holds the parent's records, which
+        the parent writes itself. Pointing the file descriptor at /dev/null
+        turns any later flush or close into a no-op write, without closing
+        the descriptor (which could then be reused by another file).
+        """
+        if self.stream is None:
+            return
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        try:
+            os.dup2(devnull, self.stream.fileno())
+        finally:
+            os.close(devnull)
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers each time the queue empties."""
+
+    def dequeue(self, block: bool):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                flush_now = getattr(handler, 'flush_now', None)
+                if flush_now is not None:
+                    flush_now()
+            return self.queue.get(block)
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a queue read by a thread in this same process.
+
+    The stock prepare() formats the whole record and copies it so it can
+    be pickled to another process. Here the record never leaves the
+    process, so only the message arguments are merged now (they could be
+    mutated before the listener runs) and the file formatter does the
+    rest on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = _record_message(record)
+        record.args = None
+        return record
+
+
+def _after_fork_in_child() -> None:
+    """
+    Give a forked child process a log file handler that actually writes.
+
+    A child created with fork() (multiprocessing pools on Linux, e.g.
+    ImageParser.parse_many) inherits the QueueHandler but not the listener
+    thread, so records it queued would never reach the file. The queue
+    handler is replaced with a plain synchronous FileHandler on the same
+    file; it flushes every record, so nothing is lost when a pool worker
+    exits with os._exit().
+    """
+    global _QUEUE_LISTENER
+    listener, _QUEUE_LISTENER = _QUEUE_LISTENER, None
+    if listener is None:
+        return
+
+    root_logger = logging.getLogger()
+    for inherited in listener.handlers:
+        if not isinstance(inherited, _BatchingFileHandler):
+            continue
+        inherited.discard()
+
+        file_handler = logging.FileHandler(
+            inherited.baseFilename, mode='a', encoding='utf-8'
+        )
+        file_handler.setLevel(inherited.level)
+        file_handler.setFormatter(_DETAILED_FORMATTER)
+
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, _InProcessQueueHandler):
+                root_logger.removeHandler(handler)
+        root_logger.addHandler(file_handler)
+
+    _ACTIVE_HANDLERS[:] = root_logger.handlers
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
 # ============================================================================
 # Configuration Functions
 # ============================================================================
@@ -82,6 +277,23 @@ def setup_logging(
     5. Handler formats message using formatter
     6. Handler outputs to destination (console, file, etc.)
 
+    File output goes through a queue: the calling thread only puts the
+    record on a queue (QueueHandler), and a background QueueListener
+    thread formats it and writes it to the file. A FileHandler on the
+    calling thread would block every log call on a disk write, and the
+    stock QueueHandler would still format and copy each record there.
+    The listener buffers what it writes and flushes whenever the queue
+    is empty, so bursts of records reach the disk in a few large writes
+    rather than one write per line. Console output stays synchronous so
+    messages appear in order. Queued records are written out when
+    logging is reconfigured and at interpreter exit. Processes forked
+    after this call log to the file directly (see _after_fork_in_child).
+
+    Calling this again with the same log_file and verbose flag (tests,
+    repeated CLI entry points) keeps the installed handlers - the log
+    file is not closed and reopened - and only updates the level, if it
+    changed. Handlers are rebuilt if anything else removed them.
+
     Args:
         level: Logging level (use logging.DEBUG, logging.INFO, etc.)
         log_file: Optional path to log file. If provided, logs to file and console
@@ -98,20 +310,36 @@ def setup_logging(
         ...     verbose=True
         ... )
     """
-    # Clear any existing handlers
+    global _QUEUE_LISTENER, _ACTIVE_CONFIG
+
     root_logger = logging.getLogger()
+
+    # Same destinations and format as last time: keep the handlers
+    config = (str(log_file) if log_file else None, verbose)
+    if config == _ACTIVE_CONFIG and root_logger.handlers == _ACTIVE_HANDLERS:
+        if root_logger.level != level:
+            _set_handler_levels(level)
+        return
+
+    # Forget loggers handed out before this (re)configuration
+    _LOGGER_CACHE.clear()
+
+    # Finish writing (and close) any previous log file
+    _stop_queue_listener()
+
+    # Clear any existing handlers
     root_logger.handlers.clear()
+    _ACTIVE_CONFIG = None
 
     # Set root logger level
     root_logger.setLevel(level)
 
     # Choose format based on verbose flag
-    format_string = DETAILED_FORMAT if verbose else SIMPLE_FORMAT
+    console_formatter = _DETAILED_FORMATTER if verbose else _SIMPLE_FORMATTER
 
     # Console handler (stderr for logging convention)
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(level)
-    console_formatter = logging.Formatter(format_string, TIMESTAMP_FORMAT)
     console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
 
@@ -121,12 +349,20 @@ def setup_logging(
             # Create log directory if it doesn't exist
             log_file.parent.mkdir(parents=True, exist_ok=True)
 
-            file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+            file_handler = _BatchingFileHandler(log_file, mode='a', encoding='utf-8')
             file_handler.setLevel(level)
             # Always use detailed format for file output
-            file_formatter = logging.Formatter(DETAILED_FORMAT, TIMESTAMP_FORMAT)
-            file_handler.setFormatter(file_formatter)
-            root_logger.addHandler(file_handler)
+            file_handler.setFormatter(_DETAILED_FORMATTER)
+
+            # Callers only enqueue; the listener thread does the writing
+            log_queue = queue.SimpleQueue()
+            queue_handler = _InProcessQueueHandler(log_queue)
+            queue_handler.setLevel(level)
+            root_logger.addHandler(queue_handler)
+            _QUEUE_LISTENER = _BatchingQueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            _QUEUE_LISTENER.start()
 
             logging.info(f"Logging to file: {log_file}")
         except (IOError, OSError) as e:
@@ -136,14 +372,30 @@ def setup_logging(
     package_logger = logging.getLogger('data_alchemist')
     package_logger.setLevel(level)
 
+    # Remember what was installed (a failed log file is retried next time)
+    _ACTIVE_HANDLERS[:] = root_logger.handlers
+    if not log_file or _QUEUE_LISTENER is not None:
+        _ACTIVE_CONFIG = config
+
     if verbose:
         logging.debug("Logging configured successfully")
-        logging.debug(f"Log level: {logging.getLevelName(level)}")
+        logging.debug("Log level: %s", _level_name(level))
         logging.debug(f"Format: {'detailed' if verbose else 'simple'}")
         if log_file:
             logging.debug(f"Log file: {log_file}")
 
 
+def _set_handler_levels(level: int) -> None:
+    """Apply a new level to the root logger, package logger and handlers."""
+    logging.getLogger().setLevel(level)
+    logging.getLogger('data_alchemist').setLevel(level)
+    for handler in _ACTIVE_HANDLERS:
+        handler.setLevel(level)
+    if _QUEUE_LISTENER is not None:
+        for handler in _QUEUE_LISTENER.handlers:
+            handler.setLevel(level)
+
+
 def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """
     Get a logger instance for a module.
@@ -162,6 +414,13 @@ def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     - Consistent naming convention
     - Hierarchical control (can set level for entire package)
 
+    logging.getLogger() takes the logging module's global lock on every
+    call. Loggers live for the whole process, so each one is remembered
+    in _LOGGER_CACHE and repeated calls (from decorators, context
+    managers, per-call helpers) are a plain dict lookup. setLevel() -
+    which also clears logging's internal level caches - only runs when
+    the requested level differs from the current one.
+
     Args:
         name: Logger name (typically __name__ of the module)
         level: Optional level to set for this specific logger
@@ -177,9 +436,11 @@ def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
         >>> logger.warning("Missing header row")
         >>> logger.error("Failed to parse column 5")
     """
-    logger = logging.getLogger(name)
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = _LOGGER_CACHE[name] = logging.getLogger(name)
 
-    if level is not None:
+    if level is not None and logger.level != level:
         logger.setLevel(level)
 
     return logger
@@ -206,7 +467,7 @@ def set_package_log_level(level: int) -> None:
     """
     package_logger = logging.getLogger('data_alchemist')
     package_logger.setLevel(level)
-    logging.debug(f"Set data_alchemist log level to {logging.getLevelName(level)}")
+    logging.debug("Set data_alchemist log level to %s", _level_name(level))
 
 
 def disable_module_logging(module_name: str) -> None:
@@ -280,7 +541,7 @@ class TemporaryLogLevel:
 # Utility Functions
 # ============================================================================
 
-def log_function_call(logger: logging.Logger):
+def log_function_call(logger: logging.Logger, dynamic: bool = True):
     """
     Decorator to log function calls.
 
@@ -288,6 +549,18 @@ def log_function_call(logger: logging.Logger):
     Decorators wrap functions to add behavior. This one logs
     when a function is called and when it returns.
 
+    Building the call signature means calling repr() on every argument,
+    which for DataFrames or numpy arrays can take milliseconds. The
+    wrapper checks logger.isEnabledFor(logging.DEBUG) first and skips
+    that work entirely when DEBUG messages would be dropped anyway.
+
+    With dynamic=False the DEBUG check happens once, when the function
+    is decorated: if DEBUG is off then, the function gets a slimmer
+    wrapper that only logs exceptions, and turning DEBUG on later has no
+    effect on it. Decorators usually run at import time, before
+    setup_logging(), so only use this for hot functions whose logger
+    level is already settled when they are defined.
+
     Useful for:
     - Debugging function execution flow
     - Performance monitoring (can add timing)
@@ -295,6 +568,8 @@ def log_function_call(logger: logging.Logger):
 
     Args:
         logger: Logger to use for messages
+        dynamic: If True (default), check the logger level on every call;
+            if False, check it once at decoration time
 
     Example:
         >>> logger = get_logger(__name__)
@@ -309,17 +584,34 @@ def log_function_call(logger: logging.Logger):
         >>> # DEBUG: parse_file returned successfully
     """
     def decorator(func):
+        if not dynamic and not logger.isEnabledFor(logging.DEBUG):
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(
+                        f"{func.__name__} raised {type(e).__name__}: {e}",
+                        exc_info=True
+                    )
+                    raise
+
+            return wrapper
+
         def wrapper(*args, **kwargs):
-            # Log function call
-            args_repr = [repr(a) for a in args]
-            kwargs_repr = [f"{k}={v!r}" for k, v in kwargs.items()]
-            signature = ", ".join(args_repr + kwargs_repr)
-            logger.debug(f"Calling {func.__name__}({signature})")
+            # Only build the (possibly huge) argument reprs if DEBUG is on
+            debug_on = logger.isEnabledFor(logging.DEBUG)
+            if debug_on:
+                # Log function call
+                args_repr = [repr(a) for a in args]
+                kwargs_repr = [f"{k}={v!r}" for k, v in kwargs.items()]
+                signature = ", ".join(args_repr + kwargs_repr)
+                logger.debug("Calling %s(%s)", func.__name__, signature)
 
             try:
                 # Execute function
                 result = func(*args, **kwargs)
-                logger.debug(f"{func.__name__} returned successfully")
+                if debug_on:
+                    logger.debug("%s returned successfully", func.__name__)
                 return result
             except Exception as e:
                 # Log exception
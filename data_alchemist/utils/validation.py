@@ -15,14 +15,29 @@ Purpose: Validate preconditions before proceeding with operations
 """
 
 import logging
+import os
 import signal
+import stat
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 from contextlib import contextmanager
 from functools import wraps
 
+# Log calls pass %-style arguments instead of f-strings so messages are
+# only formatted if their level is enabled; debug messages that need
+# extra arithmetic (MB conversions, thousands separators) are also
+# guarded by logger.isEnabledFor(logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# psutil is optional; without it check_available_memory() reports 0
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 
 # ============================================================================
 # Constants
@@ -35,6 +50,32 @@ MAX_LOG_FILE_SIZE = 1024 * 1024 * 1024   # 1 GB for logs
 MAX_WAV_FILE_SIZE = 500 * 1024 * 1024    # 500 MB for WAV
 MAX_IMAGE_FILE_SIZE = 50 * 1024 * 1024   # 50 MB for images
 
+# Per-type size limits used by validate_file_size()
+_FILE_SIZE_LIMITS = {
+    'csv': MAX_CSV_FILE_SIZE,
+    'log': MAX_LOG_FILE_SIZE,
+    'wav': MAX_WAV_FILE_SIZE,
+    'png': MAX_IMAGE_FILE_SIZE,
+    'jpeg': MAX_IMAGE_FILE_SIZE,
+    'jpg': MAX_IMAGE_FILE_SIZE,
+}
+
+# Rough parse-time memory / file size ratios, by file type
+_MEMORY_MULTIPLIERS = {
+    'csv': 3.0,     # DataFrames have significant overhead
+    'log': 1.5,     # Line-by-line processing
+    'wav': 1.2,     # numpy arrays are efficient
+    'png': 4.0,     # Uncompressed pixels
+    'jpeg': 3.5,    # JPEG compression ~10-20x
+    'jpg': 3.5,
+}
+
+# check_available_memory() re-reads system memory at most this often
+_MEMORY_CHECK_INTERVAL = 0.5  # seconds
+
+# (time.monotonic() of the last reading, available bytes)
+_memory_reading: Tuple[float, int] = (float('-inf'), 0)
+
 # Default timeout limits (seconds)
 DEFAULT_PARSE_TIMEOUT = 60      # 60 seconds for parsing
 DEFAULT_DETECT_TIMEOUT = 5      # 5 seconds for detection
@@ -63,7 +104,10 @@ class TimeoutError(ValidationError):
 # File Validation Functions
 # ============================================================================
 
-def validate_file_exists(file_path: Path) -> None:
+def validate_file_exists(
+    file_path: Path,
+    stat_result: Optional[os.stat_result] = None
+) -> os.stat_result:
     """
     Validate that a file exists and is readable.
 
@@ -71,8 +115,20 @@ def validate_file_exists(file_path: Path) -> None:
     Early validation prevents wasting resources on non-existent files.
     Provides clear error messages for common issues.
 
+    Existence and "is a regular file" are both read off one os.stat()
+    call (Path.exists() and Path.is_file() would each stat the file
+    again), and readability is checked with os.access() rather than
+    opening the file and reading a byte. The stat result is returned so
+    callers can pass it on to validate_file_not_empty() and
+    validate_file_size() instead of statting a third and fourth time.
+
     Args:
         file_path: Path to validate
+        stat_result: Optional os.stat_result already taken for file_path
+            (skips the stat; only readability is checked on disk)
+
+    Returns:
+        The os.stat_result for file_path
 
     Raises:
         FileNotFoundError: If file doesn't exist
@@ -82,26 +138,30 @@ def validate_file_exists(file_path: Path) -> None:
     if not isinstance(file_path, Path):
         file_path = Path(file_path)
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    st = stat_result
+    if st is None:
+        try:
+            st = file_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found: {file_path}")
 
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Path is not a file: {file_path}")
 
     # Test readability
-    try:
-        with open(file_path, 'rb') as f:
-            f.read(1)  # Try reading one byte
-    except PermissionError:
+    if not os.access(file_path, os.R_OK):
         raise PermissionError(f"File is not readable: {file_path}")
 
-    logger.debug(f"File validation passed: {file_path}")
+    logger.debug("File validation passed: %s", file_path)
+
+    return st
 
 
 def validate_file_size(
     file_path: Path,
     max_size: Optional[int] = None,
-    file_type: Optional[str] = None
+    file_type: Optional[str] = None,
+    stat_result: Optional[os.stat_result] = None
 ) -> int:
     """
     Validate file size is within acceptable limits.
@@ -121,6 +181,7 @@ def validate_file_size(
         file_path: Path to validate
         max_size: Maximum allowed size in bytes (None = use defaults)
         file_type: File type for type-specific limits
+        stat_result: Optional os.stat_result already taken for file_path
 
     Returns:
         File size in bytes
@@ -131,20 +192,14 @@ def validate_file_size(
     if not isinstance(file_path, Path):
         file_path = Path(file_path)
 
-    file_size = file_path.stat().st_size
+    if stat_result is None:
+        stat_result = file_path.stat()
+    file_size = stat_result.st_size
 
     # Determine max size based on file type if not specified
     if max_size is None:
         if file_type:
-            type_limits = {
-                'csv': MAX_CSV_FILE_SIZE,
-                'log': MAX_LOG_FILE_SIZE,
-                'wav': MAX_WAV_FILE_SIZE,
-                'png': MAX_IMAGE_FILE_SIZE,
-                'jpeg': MAX_IMAGE_FILE_SIZE,
-                'jpg': MAX_IMAGE_FILE_SIZE,
-            }
-            max_size = type_limits.get(file_type.lower(), MAX_FILE_SIZE_BYTES)
+            max_size = _FILE_SIZE_LIMITS.get(file_type.lower(), MAX_FILE_SIZE_BYTES)
         else:
             max_size = MAX_FILE_SIZE_BYTES
 
@@ -157,20 +212,25 @@ def validate_file_size(
             f"Tip: Process smaller files or increase limit"
         )
 
-    logger.debug(
-        f"File size validation passed: {file_size:,} bytes "
-        f"(limit: {max_size:,} bytes)"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "File size validation passed: %s bytes (limit: %s bytes)",
+            format(file_size, ','), format(max_size, ',')
+        )
 
     return file_size
 
 
-def validate_file_not_empty(file_path: Path) -> None:
+def validate_file_not_empty(
+    file_path: Path,
+    stat_result: Optional[os.stat_result] = None
+) -> None:
     """
     Validate that file is not empty.
 
     Args:
         file_path: Path to validate
+        stat_result: Optional os.stat_result already taken for file_path
 
     Raises:
         ValueError: If file is empty
@@ -178,7 +238,9 @@ def validate_file_not_empty(file_path: Path) -> None:
     if not isinstance(file_path, Path):
         file_path = Path(file_path)
 
-    file_size = file_path.stat().st_size
+    if stat_result is None:
+        stat_result = file_path.stat()
+    file_size = stat_result.st_size
 
     if file_size == 0:
         raise ValueError(
@@ -186,7 +248,7 @@ def validate_file_not_empty(file_path: Path) -> None:
             f"Tip: Ensure file contains data before parsing"
         )
 
-    logger.debug(f"File not empty: {file_size} bytes")
+    logger.debug("File not empty: %d bytes", file_size)
 
 
 # ============================================================================
@@ -203,20 +265,66 @@ def _timeout_handler(signum, frame):
     raise TimeoutException("Operation timed out")
 
 
+# Deadlines (time.monotonic() values) of the timeout() blocks active in
+# each thread, innermost last
+_deadlines = threading.local()
+
+
+def _active_deadlines() -> List[Tuple[float, int, str]]:
+    """Return this thread's stack of (deadline, seconds, name) entries."""
+    stack = getattr(_deadlines, 'stack', None)
+    if stack is None:
+        stack = _deadlines.stack = []
+    return stack
+
+
+def _timeout_error(seconds: int, operation_name: str) -> TimeoutError:
+    """Build the TimeoutError raised when a deadline passes."""
+    return TimeoutError(
+        f"{operation_name} timed out after {seconds} seconds\n"
+        f"Tip: File may be corrupted, too large, or processing is too slow"
+    )
+
+
+def check_timeout() -> None:
+    """
+    Raise TimeoutError if the innermost active timeout() has expired.
+
+    Educational Note:
+    In the main thread timeout() interrupts work with a signal. Signals
+    cannot be used in other threads (e.g. CSVParser.parse_many), so
+    long-running loops also call this between chunks of work (e.g. once
+    per block of log lines). It costs one time.monotonic() call, and does
+    nothing outside a timeout() block.
+
+    Raises:
+        TimeoutError: If the current thread's deadline has passed
+    """
+    stack = getattr(_deadlines, 'stack', None)
+    if stack:
+        deadline, seconds, operation_name = stack[-1]
+        if time.monotonic() > deadline:
+            raise _timeout_error(seconds, operation_name)
+
+
 @contextmanager
 def timeout(seconds: int, operation_name: str = "Operation"):
     """
     Context manager for timeout protection.
 
     Educational Note:
-    This uses UNIX signals to interrupt long-running operations.
     Prevents operations from hanging indefinitely on:
     - Corrupted files that cause infinite loops
     - Extremely large files that take too long
     - Network-mounted files with latency
 
-    Note: Only works on UNIX systems (Linux, macOS).
-    On Windows, timeout is not enforced but operation still proceeds.
+    In the main thread on UNIX this uses a SIGALRM timer, which interrupts
+    the block wherever it is (as soon as control returns to Python from any
+    C call). signal.signal() only works in the main thread and not at all
+    on Windows, so every block also records a deadline for the current
+    thread: code that may run in worker threads calls check_timeout()
+    between chunks of work to honour it there. Work that finishes in time
+    is never failed after the fact.
 
     Args:
         seconds: Maximum seconds to allow
@@ -229,30 +337,50 @@ def timeout(seconds: int, operation_name: str = "Operation"):
         >>> with timeout(5, "File parsing"):
         ...     parse_large_file()  # Will be interrupted after 5 seconds
     """
-    # Check if signal.alarm is available (UNIX only)
-    if not hasattr(signal, 'SIGALRM'):
-        # Windows or other platforms - just yield without timeout
-        logger.debug(f"Timeout not supported on this platform, proceeding without timeout")
-        yield
-        return
+    stack = _active_deadlines()
+    started = time.monotonic()
+    stack.append((started + seconds, seconds, operation_name))
 
-    # Set up timeout
-    old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
-    signal.alarm(seconds)
+    use_alarm = (
+        hasattr(signal, 'SIGALRM')
+        and threading.current_thread() is threading.main_thread()
+    )
+    outer_first = False
+    if use_alarm:
+        old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
+        outer_remaining, _ = signal.getitimer(signal.ITIMER_REAL)
+        # An enclosing timeout() that expires sooner keeps its own alarm
+        outer_first = (
+            old_handler is _timeout_handler
+            and 0 < outer_remaining < seconds
+        )
+        # setitimer accepts fractions of a second; 0 would disarm the timer
+        signal.setitimer(
+            signal.ITIMER_REAL,
+            max(outer_remaining if outer_first else seconds, 1e-6)
+        )
+    logger.debug("%s: timeout set to %s seconds", operation_name, seconds)
 
     try:
-        logger.debug(f"{operation_name}: timeout set to {seconds} seconds")
         yield
     except TimeoutException:
-        raise TimeoutError(
-            f"{operation_name} timed out after {seconds} seconds\n"
-            f"Tip: File may be corrupted, too large, or processing is too slow"
-        )
+        if outer_first:
+            outer_remaining = 0  # it has fired; don't re-arm it
+            raise  # the enclosing block's deadline, not ours
+        raise _timeout_error(seconds, operation_name)
     finally:
-        # Cancel alarm and restore old handler
-        signal.alarm(0)
-        signal.signal(signal.SIGALRM, old_handler)
-        logger.debug(f"{operation_name}: timeout cleared")
+        if use_alarm:
+            # Cancel alarm, restore old handler and any enclosing timer
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(
+                signal.SIGALRM,
+                old_handler if old_handler is not None else signal.SIG_DFL
+            )
+            if outer_remaining:
+                elapsed = time.monotonic() - started
+                signal.setitimer(signal.ITIMER_REAL, max(outer_remaining - elapsed, 1e-6))
+        stack.pop()
+        logger.debug("%s: timeout cleared", operation_name)
 
 
 def timeout_decorator(seconds: int, operation_name: str = "Operation"):
@@ -289,7 +417,8 @@ def timeout_decorator(seconds: int, operation_name: str = "Operation"):
 def validate_file_for_parsing(
     file_path: Path,
     file_type: Optional[str] = None,
-    max_size: Optional[int] = None
+    max_size: Optional[int] = None,
+    stat_result: Optional[os.stat_result] = None
 ) -> dict:
     """
     Comprehensive validation for file before parsing.
@@ -307,12 +436,16 @@ def validate_file_for_parsing(
         file_path: Path to validate
         file_type: Optional file type for type-specific validation
         max_size: Optional custom size limit
+        stat_result: Optional os.stat_result the caller already has for
+            file_path (e.g. from a directory scan); no stat() is made
 
     Returns:
         Dictionary with validation results:
         - valid: True if all checks passed
         - file_size: Size in bytes
         - checks: Dict of individual check results
+        - stat_result: The os.stat_result the checks used, for callers
+          that need more of it without another stat()
 
     Raises:
         ValidationError: If any validation fails
@@ -320,37 +453,40 @@ def validate_file_for_parsing(
     if not isinstance(file_path, Path):
         file_path = Path(file_path)
 
-    logger.info(f"Validating file for parsing: {file_path}")
+    logger.info("Validating file for parsing: %s", file_path)
 
     validation_results = {
         'file_path': str(file_path),
         'file_type': file_type,
         'valid': False,
         'file_size': 0,
-        'checks': {}
+        'checks': {},
+        'stat_result': None
     }
 
     try:
         # Check 1: File exists and is readable
-        validate_file_exists(file_path)
+        # (one stat, reused by the checks below)
+        st = validate_file_exists(file_path, stat_result)
+        validation_results['stat_result'] = st
         validation_results['checks']['exists'] = True
         validation_results['checks']['readable'] = True
 
         # Check 2: File is not empty
-        validate_file_not_empty(file_path)
+        validate_file_not_empty(file_path, st)
         validation_results['checks']['not_empty'] = True
 
         # Check 3: File size is within limits
-        file_size = validate_file_size(file_path, max_size, file_type)
+        file_size = validate_file_size(file_path, max_size, file_type, st)
         validation_results['file_size'] = file_size
         validation_results['checks']['size_ok'] = True
 
         # All checks passed
         validation_results['valid'] = True
-        logger.info(f"File validation passed: {file_path}")
+        logger.info("File validation passed: %s", file_path)
 
     except Exception as e:
-        logger.error(f"File validation failed: {e}")
+        logger.error("File validation failed: %s", e)
         raise
 
     return validation_results
@@ -360,7 +496,11 @@ def validate_file_for_parsing(
 # Resource Monitoring
 # ============================================================================
 
-def estimate_memory_usage(file_path: Path, file_type: Optional[str] = None) -> int:
+def estimate_memory_usage(
+    file_path: Path,
+    file_type: Optional[str] = None,
+    file_size: Optional[int] = None
+) -> int:
     """
     Estimate memory usage for parsing a file.
 
@@ -376,30 +516,24 @@ def estimate_memory_usage(file_path: Path, file_type: Optional[str] = None) -> i
     Args:
         file_path: Path to file
         file_type: File type for type-specific estimates
+        file_size: File size in bytes, if already known (e.g. from
+            validate_file_size); skips stat()ing the file again
 
     Returns:
         Estimated memory usage in bytes
     """
-    file_size = file_path.stat().st_size
-
-    # Memory multipliers by file type
-    multipliers = {
-        'csv': 3.0,     # DataFrames have significant overhead
-        'log': 1.5,     # Line-by-line processing
-        'wav': 1.2,     # numpy arrays are efficient
-        'png': 4.0,     # Uncompressed pixels
-        'jpeg': 3.5,    # JPEG compression ~10-20x
-        'jpg': 3.5,
-    }
+    if file_size is None:
+        file_size = file_path.stat().st_size
 
-    multiplier = multipliers.get(file_type.lower() if file_type else None, 2.0)
+    multiplier = _MEMORY_MULTIPLIERS.get(file_type.lower() if file_type else None, 2.0)
     estimated_memory = int(file_size * multiplier)
 
-    logger.debug(
-        f"Estimated memory usage: {estimated_memory:,} bytes "
-        f"({estimated_memory / (1024**2):.1f} MB) "
-        f"for {file_size:,} byte {file_type or 'unknown'} file"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Estimated memory usage: %s bytes (%.1f MB) for %s byte %s file",
+            format(estimated_memory, ','), estimated_memory / (1024**2),
+            format(file_size, ','), file_type or 'unknown'
+        )
 
     return estimated_memory
 
@@ -413,17 +547,34 @@ def check_available_memory() -> int:
     On production systems, you might want more sophisticated
     resource management.
 
+    psutil.virtual_memory() parses /proc/meminfo (or the platform
+    equivalent) into a namedtuple each time. Free memory doesn't change
+    meaningfully within half a second, so a reading is reused for
+    _MEMORY_CHECK_INTERVAL seconds when this is called in a loop.
+
     Returns:
         Estimated available memory in bytes, or 0 if cannot determine
     """
+    global _memory_reading
+
+    if not PSUTIL_AVAILABLE:
+        logger.debug("psutil not available, cannot check memory")
+        return 0  # Unknown
+
+    now = time.monotonic()
+    read_at, available = _memory_reading
+    if now - read_at < _MEMORY_CHECK_INTERVAL:
+        return available
+
     try:
-        import psutil
         available = psutil.virtual_memory().available
-        logger.debug(f"Available memory: {available:,} bytes ({available / (1024**2):.1f} MB)")
+        _memory_reading = (now, available)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Available memory: %s bytes (%.1f MB)",
+                format(available, ','), available / (1024**2)
+            )
         return available
-    except ImportError:
-        logger.debug("psutil not available, cannot check memory")
-        return 0  # Unknown
     except Exception as e:
-        logger.warning(f"Error checking available memory: {e}")
+        logger.warning("Error checking available memory: %s", e)
         return 0
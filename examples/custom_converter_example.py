@@ -17,6 +17,7 @@ Educational Focus:
 import sys
 from pathlib import Path
 from datetime import datetime
+from itertools import zip_longest
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -137,26 +138,24 @@ class TextReportConverter(Converter):
             lines.append(f"Sample Data (first {min(5, len(rows))} rows):")
             lines.append("")
 
-            # Calculate column widths
-            col_widths = [len(str(h)) for h in headers]
-            for row in rows[:5]:
-                for i, value in enumerate(row[:len(headers)]):
-                    col_widths[i] = max(col_widths[i], len(str(value)))
+            # Convert every cell to text once; widths and padding reuse it
+            header_cells = [str(h) for h in headers]
+            sample = [[str(v) for v in row[:len(headers)]] for row in rows[:5]]
+
+            # Calculate column widths (zip_longest: short rows pad with '')
+            col_widths = [
+                max(map(len, column))
+                for column in zip_longest(header_cells, *sample, fillvalue='')
+            ]
 
             # Print header
-            header_line = " | ".join(
-                str(h).ljust(w) for h, w in zip(headers, col_widths)
-            )
+            header_line = " | ".join(map(str.ljust, header_cells, col_widths))
             lines.append(header_line)
             lines.append("-" * len(header_line))
 
             # Print rows
-            for row in rows[:5]:
-                row_values = row[:len(headers)]
-                row_line = " | ".join(
-                    str(v).ljust(w) for v, w in zip(row_values, col_widths)
-                )
-                lines.append(row_line)
+            for cells in sample:
+                lines.append(" | ".join(map(str.ljust, cells, col_widths)))
 
         return lines
 
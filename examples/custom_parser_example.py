@@ -17,7 +17,6 @@ Educational Focus:
 import sys
 from pathlib import Path
 from typing import Dict, Any
-import re
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -28,6 +27,20 @@ from data_alchemist.core.plugin_manager import PluginManager
 from data_alchemist.converters.json_converter import JSONConverter
 
 
+# Value spellings INIParser._convert_value() turns into booleans
+_TRUE_WORDS = frozenset(('true', 'yes', 'on'))
+_FALSE_WORDS = frozenset(('false', 'no', 'off'))
+
+# First characters of anything int() or float() can parse (digits, sign,
+# '.', or inf/nan); other ASCII values skip both conversion attempts
+_NUMBER_FIRST_CHARS = frozenset('0123456789+-.iInN')
+
+
+def _is_section_header(line: str) -> bool:
+    """True for a stripped line like '[name]': a bracketed, non-empty name."""
+    return len(line) > 2 and line[0] == '[' and line[-1] == ']'
+
+
 class INIParser(Parser):
     """
     Custom parser for INI-style configuration files.
@@ -63,7 +76,7 @@ class INIParser(Parser):
                     line = line.strip()
                     if line and not line.startswith('#'):
                         # Look for section headers [section] or key=value pairs
-                        if re.match(r'^\[.+\]$', line) or '=' in line:
+                        if _is_section_header(line) or '=' in line:
                             return True
             return False
         except Exception:
@@ -87,34 +100,29 @@ class INIParser(Parser):
 
         try:
             config = {}
-            current_section = 'DEFAULT'
-            config[current_section] = {}
+            section = config['DEFAULT'] = {}
 
+            # Each line is handled with str.partition/strip and index
+            # checks - single C calls - rather than a regex match plus
+            # split() lists per line
             with open(file_path, 'r', encoding='utf-8') as f:
                 for line_num, line in enumerate(f, 1):
                     # Remove comments and whitespace
-                    line = line.split('#')[0].strip()
+                    line = line.partition('#')[0].strip()
 
                     if not line:
                         continue
 
                     # Check for section header
-                    section_match = re.match(r'^\[(.+)\]$', line)
-                    if section_match:
-                        current_section = section_match.group(1)
-                        config[current_section] = {}
+                    if _is_section_header(line):
+                        section = config[line[1:-1]] = {}
                         continue
 
                     # Parse key=value pair
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-
+                    key, sep, value = line.partition('=')
+                    if sep:
                         # Try to convert value to appropriate type
-                        value = self._convert_value(value)
-
-                        config[current_section][key] = value
+                        section[key.strip()] = self._convert_value(value.strip())
                     else:
                         print(f"Warning: Skipping malformed line {line_num}: {line}")
 
@@ -146,24 +154,33 @@ class INIParser(Parser):
 
         Returns:
             Converted value (int, float, bool, or str)
+
+        Note:
+            A failed int()/float() raises and catches an exception, which
+            costs far more than a lookup - and most INI values (hosts,
+            names, paths) are plain strings. Checking the first character
+            lets those skip both attempts.
         """
         # Try boolean
-        if value.lower() in ['true', 'yes', 'on']:
+        lowered = value.lower()
+        if lowered in _TRUE_WORDS:
             return True
-        if value.lower() in ['false', 'no', 'off']:
+        if lowered in _FALSE_WORDS:
             return False
 
-        # Try integer
-        try:
-            return int(value)
-        except ValueError:
-            pass
-
-        # Try float
-        try:
-            return float(value)
-        except ValueError:
-            pass
+        first = value[:1]
+        if first in _NUMBER_FIRST_CHARS or not first.isascii():
+            # Try integer
+            try:
+                return int(value)
+            except ValueError:
+                pass
+
+            # Try float
+            try:
+                return float(value)
+            except ValueError:
+                pass
 
         # Return as string
         return value
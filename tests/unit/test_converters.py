@@ -16,7 +16,7 @@ from datetime import datetime
 
 from data_alchemist.converters.json_converter import JSONConverter
 from data_alchemist.converters.csv_converter import CSVConverter
-from data_alchemist.core.models import IntermediateData, ConverterError
+from data_alchemist.core.models import IntermediateData, ConverterError, RowView
 
 
 class TestJSONConverter(unittest.TestCase):
@@ -174,6 +174,20 @@ class TestJSONConverter(unittest.TestCase):
         with self.assertRaises(ConverterError):
             self.converter.convert("not intermediate data", output_path)
 
+    def test_unserializable_data_leaves_no_file(self):
+        """Test a serialization failure leaves no partial output behind."""
+        output_path = Path(self.temp_dir) / 'broken.json'
+        data = IntermediateData(
+            source_file="/test/file.txt",
+            file_type="text",
+            data={'rows': [1, 2, object()]}
+        )
+
+        with self.assertRaises(ConverterError):
+            self.converter.convert(data, output_path)
+
+        self.assertEqual(list(Path(self.temp_dir).iterdir()), [])
+
 
 class TestCSVConverter(unittest.TestCase):
     """Test suite for CSV Converter."""
@@ -233,6 +247,33 @@ class TestCSVConverter(unittest.TestCase):
         self.assertIn('Alice', content)
         self.assertIn('Bob', content)
 
+    def test_convert_columnar_data(self):
+        """Test columnar CSV data (one array per column) writes as a table."""
+        import numpy as np
+
+        data = IntermediateData(
+            source_file="/test/input.csv",
+            file_type="csv",
+            data={
+                'columns': ['name', 'age'],
+                'arrays': [np.array(['Alice', 'Bob'], dtype=object), np.array([30, 25])],
+                'row_count': 2,
+                'column_count': 2
+            }
+        )
+
+        output_path = Path(self.temp_dir) / 'columnar.csv'
+        self.converter.convert(data, output_path)
+
+        lines = output_path.read_text().strip().split('\n')
+        self.assertEqual(lines, ['name,age', 'Alice,30', 'Bob,25'])
+
+        # JSON output serializes the arrays as plain lists
+        json_path = Path(self.temp_dir) / 'columnar.json'
+        JSONConverter().convert(data, json_path)
+        with open(json_path) as f:
+            self.assertEqual(json.load(f)['data']['arrays'][1], [30, 25])
+
     def test_convert_non_tabular_data(self):
         """Test converting non-tabular data (metadata) to key-value CSV."""
         # Create non-tabular data (like from WAV or image parser)
@@ -260,6 +301,22 @@ class TestCSVConverter(unittest.TestCase):
         self.assertIn('sample_rate', content)
         self.assertIn('44100', content)
 
+    def test_convert_lazy_sequence_field(self):
+        """Test lazy row views are written like the lists they replace."""
+        entries = RowView(['level', 'message'], [['INFO', 'WARN'], ['up', 'slow']], 2)
+        data = IntermediateData(
+            source_file="/test/app.log",
+            file_type="log",
+            data={'entries': entries, 'entry_count': 2}
+        )
+
+        output_path = Path(self.temp_dir) / 'log.csv'
+        self.converter.convert(data, output_path)
+
+        content = output_path.read_text()
+        self.assertIn("'level': 'INFO', 'message': 'up'", content)
+        self.assertNotIn('<rows:', content)
+
     def test_convert_with_metadata_flag(self):
         """Test including metadata in CSV output."""
         data = IntermediateData(
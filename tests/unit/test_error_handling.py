@@ -27,7 +27,11 @@ from data_alchemist.utils.validation import (
     validate_file_size,
     validate_file_not_empty,
     validate_file_for_parsing,
-    estimate_memory_usage
+    estimate_memory_usage,
+    timeout,
+    timeout_decorator,
+    check_timeout,
+    TimeoutError as ValidationTimeoutError
 )
 from data_alchemist.parsers import CSVParser, LogParser, WAVParser, ImageParser
 
@@ -92,6 +96,20 @@ class TestFileValidation(unittest.TestCase):
         file_size = validate_file_size(small_file, max_size=10000)
         self.assertGreater(file_size, 0)
 
+    def test_validate_file_exists_stat_is_reused(self):
+        """Test the stat result from validate_file_exists feeds the size check."""
+        small_file = Path(self.temp_dir) / "small.csv"
+        small_file.write_text("name,age\nAlice,30\n")
+
+        st = validate_file_exists(small_file)
+        self.assertEqual(st.st_size, small_file.stat().st_size)
+
+        # The passed-in stat result is used instead of statting again
+        small_file.write_text("")
+        self.assertEqual(validate_file_size(small_file, 10000, None, st), st.st_size)
+        result = validate_file_for_parsing(small_file, stat_result=st)
+        self.assertEqual(result['file_size'], st.st_size)
+
     def test_comprehensive_validation(self):
         """Test comprehensive file validation."""
         valid_file = Path(self.temp_dir) / "valid.csv"
@@ -110,6 +128,66 @@ class TestFileValidation(unittest.TestCase):
         self.assertTrue(result['checks']['size_ok'])
 
 
+class TestTimeout(unittest.TestCase):
+    """Test the timeout utilities."""
+
+    def test_check_timeout_outside_block_is_noop(self):
+        """Test check_timeout does nothing without an active timeout."""
+        check_timeout()
+
+    def test_expired_deadline_raises_in_worker_thread(self):
+        """Test timeout works outside the main thread."""
+        import threading
+        import time
+        errors = []
+
+        def work():
+            try:
+                with timeout(0, "Worker parsing"):
+                    time.sleep(0.01)
+                    check_timeout()
+            except ValidationTimeoutError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Worker parsing timed out", str(errors[0]))
+
+    def test_decorator_returns_result_or_times_out(self):
+        """Test timeout_decorator returns in time even if the function doesn't."""
+        import time
+
+        @timeout_decorator(5, "Quick")
+        def quick(x):
+            return x * 2
+
+        @timeout_decorator(0.05, "Slow")
+        def slow():
+            time.sleep(0.5)
+
+        self.assertEqual(quick(21), 42)
+        start = time.monotonic()
+        with self.assertRaises(ValidationTimeoutError):
+            slow()
+        self.assertLess(time.monotonic() - start, 0.4)
+
+    def test_main_thread_interrupts_python_loop(self):
+        """Test timeout stops a loop that never calls check_timeout."""
+        with self.assertRaises(ValidationTimeoutError):
+            with timeout(0.05, "Spinning"):
+                while True:
+                    pass
+
+    def test_completed_block_is_not_failed(self):
+        """Test a block that finishes in time keeps its result."""
+        with timeout(5, "Quick"):
+            result = sum(range(10))
+        self.assertEqual(result, 45)
+
+
 class TestCSVParserErrors(unittest.TestCase):
     """Test CSV parser error handling."""
 
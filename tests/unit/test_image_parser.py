@@ -141,6 +141,93 @@ class TestImageParser(unittest.TestCase):
 
         self.assertEqual(result.data['mode'], 'L')
 
+    def test_plain_images_skip_pillow_open(self):
+        """Test plain PNG/JPEG dimensions come from the header alone."""
+        from unittest import mock
+
+        png_path = self._create_test_image(
+            Path(self.temp_dir) / 'plain.png', format='PNG', size=(64, 48), mode='RGBA'
+        )
+        jpg_path = self._create_test_image(
+            Path(self.temp_dir) / 'plain.jpg', format='JPEG', size=(64, 48), mode='L'
+        )
+
+        with mock.patch('PIL.Image.open') as mock_open:
+            png_result = self.parser.parse(png_path)
+            jpg_result = self.parser.parse(jpg_path)
+            mock_open.assert_not_called()
+
+        self.assertEqual((png_result.data['width'], png_result.data['height']), (64, 48))
+        self.assertEqual(png_result.data['mode'], 'RGBA')
+        self.assertEqual((jpg_result.data['width'], jpg_result.data['height']), (64, 48))
+        self.assertEqual(jpg_result.data['mode'], 'L')
+
+    def test_can_parse_header_reused_by_parse(self):
+        """Test parse() reuses the header bytes sniffed by can_parse()."""
+        from data_alchemist.parsers.image_parser import _sniff_cached
+
+        png_path = self._create_test_image(Path(self.temp_dir) / 'sniff.png')
+        self.assertTrue(self.parser.can_parse(png_path))
+
+        hits = _sniff_cached.cache_info().hits
+        self.parser.parse(png_path)
+        self.assertGreater(_sniff_cached.cache_info().hits, hits)
+
+    def test_parse_many_in_worker_processes(self):
+        """Test parse_many returns results for every image in input order."""
+        paths = [
+            self._create_test_image(Path(self.temp_dir) / f'batch{i}.png', size=(20 + i, 10))
+            for i in range(4)
+        ]
+
+        results = self.parser.parse_many(paths, max_workers=2)
+
+        self.assertEqual([r.source_file for r in results], [str(p) for p in paths])
+        self.assertEqual([r.data['width'] for r in results], [20, 21, 22, 23])
+
+    def test_parse_many_raises_for_non_image(self):
+        """Test parse_many reports a file that fails to parse in its worker."""
+        png_path = self._create_test_image(Path(self.temp_dir) / 'ok.png')
+        fake_path = Path(self.temp_dir) / 'fake.jpg'
+        fake_path.write_bytes(b'GIF89a' + b'\x00' * 32)
+
+        with self.assertRaises(ParserError) as context:
+            self.parser.parse_many([png_path, fake_path], max_workers=2)
+
+        self.assertIn("fake.jpg", str(context.exception))
+
+    def test_image_info_reports_whitelisted_keys_only(self):
+        """Test image_info keeps scalar format details and drops text chunks."""
+        from PIL import PngImagePlugin
+
+        png_info = PngImagePlugin.PngInfo()
+        png_info.add(b'gAMA', (45455).to_bytes(4, 'big'))
+        png_info.add_text('Comment', 'x' * 1000)
+        png_path = Path(self.temp_dir) / 'info.png'
+        Image.new('RGB', (20, 20)).save(png_path, pnginfo=png_info)
+
+        result = self.parser.parse(png_path)
+
+        self.assertEqual(result.metadata['image_info'], {'gamma': 0.45455})
+
+    def test_parse_flags_dims_only(self):
+        """Test ParseFlags.DIMS skips EXIF, mode and image info."""
+        from data_alchemist.parsers.image_parser import ParseFlags
+
+        exif = Image.Exif()
+        exif[0x010F] = 'Canon'
+        jpg_path = Path(self.temp_dir) / 'flags.jpg'
+        Image.new('RGB', (40, 30)).save(jpg_path, exif=exif.tobytes())
+
+        full = self.parser.parse(jpg_path)
+        dims = self.parser.parse(jpg_path, flags=ParseFlags.DIMS)
+
+        self.assertEqual(full.data['exif'], {'Make': 'Canon'})
+        self.assertEqual((dims.data['width'], dims.data['height']), (40, 30))
+        self.assertNotIn('exif', dims.data)
+        self.assertNotIn('mode', dims.data)
+        self.assertNotIn('image_info', dims.metadata)
+
     def test_metadata_calculation(self):
         """Test that derived metadata is calculated correctly."""
         png_path = Path(self.temp_dir) / 'metadata.png'
@@ -169,6 +256,21 @@ class TestImageParser(unittest.TestCase):
 
         self.assertIn("not found", str(context.exception).lower())
 
+    def test_parse_directory_or_empty_file(self):
+        """Test directories and empty files are rejected from the stat result."""
+        directory = Path(self.temp_dir) / 'folder.png'
+        directory.mkdir()
+        empty = Path(self.temp_dir) / 'empty.png'
+        empty.write_bytes(b'')
+
+        with self.assertRaises(ParserError) as context:
+            self.parser.parse(directory)
+        self.assertIn("not a file", str(context.exception).lower())
+
+        with self.assertRaises(ParserError) as context:
+            self.parser.parse(empty)
+        self.assertIn("empty", str(context.exception).lower())
+
     def test_parse_corrupted_image(self):
         """Test parsing corrupted image raises error."""
         corrupted = Path(self.temp_dir) / 'corrupted.png'
@@ -225,6 +327,45 @@ class TestImageParserWithoutPillow(unittest.TestCase):
         self.assertIsNotNone(parser)
         self.assertEqual(parser.parser_name, "Image Parser")
 
+    def test_parse_exif_big_endian_whitelisted_tags(self):
+        """Test the EXIF reader decodes whitelisted tags from a big-endian block."""
+        import struct
+        from data_alchemist.parsers.image_parser import _parse_exif
+
+        # TIFF header, IFD0 with Make (ASCII at offset 38), Orientation
+        # (inline SHORT) and an undefined-type tag that must be skipped
+        entries = (
+            struct.pack('>HHII', 0x010F, 2, 6, 50)
+            + struct.pack('>HHIHH', 0x0112, 3, 1, 3, 0)
+            + struct.pack('>HHII', 0x9286, 7, 4, 0)
+        )
+        tiff = b'MM\x00*' + struct.pack('>I', 8) + struct.pack('>H', 3) + entries
+        tiff += b'\x00' * 4 + b'Nikon\x00'
+
+        exif = _parse_exif(b'Exif\x00\x00' + tiff)
+
+        self.assertEqual(exif, {'Make': 'Nikon', 'Orientation': 3})
+        self.assertEqual(_parse_exif(None), {})
+
+    def test_fallback_reads_jpeg_dimensions(self):
+        """Test the no-Pillow fallback finds JPEG dimensions in the SOF0 segment."""
+        import shutil
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+
+        # Minimal JPEG: SOI, SOF0 (8-bit, 480x640, 3 components), EOI
+        sof0 = b'\x08\x01\xe0\x02\x80\x03' + b'\x01\x22\x00\x02\x11\x01\x03\x11\x01'
+        jpeg_bytes = b'\xff\xd8\xff\xc0\x00\x11' + sof0 + b'\xff\xd9'
+        jpg_path = Path(temp_dir) / 'minimal.jpg'
+        jpg_path.write_bytes(jpeg_bytes)
+
+        result = ImageParser()._parse_fallback(jpg_path, jpg_path.stat())
+
+        self.assertEqual(result.file_type, 'jpeg')
+        self.assertEqual(result.data['width'], 640)
+        self.assertEqual(result.data['height'], 480)
+        self.assertEqual(result.data['mode'], 'RGB')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,8 @@ import unittest
 from pathlib import Path
 import tempfile
 
+import numpy as np
+
 from data_alchemist.parsers.csv_parser import CSVParser
 from data_alchemist.parsers.log_parser import LogParser
 from data_alchemist.core.models import ParserError, IntermediateData
@@ -20,6 +22,12 @@ class TestCSVParser(unittest.TestCase):
         """Set up test fixtures."""
         self.parser = CSVParser()
         self.test_data_dir = Path(__file__).parent.parent / 'fixtures'
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_parser_name(self):
         """Test parser has correct name."""
@@ -89,6 +97,150 @@ class TestCSVParser(unittest.TestCase):
         first_row = result.data['rows'][0]
         self.assertIn(',', first_row['description'])
 
+    def test_parse_csv_with_short_rows(self):
+        """Test rows with missing fields are padded with empty values."""
+        csv_file = Path(self.temp_dir) / 'ragged.csv'
+        csv_file.write_text("a,b,c\n1,2\n3,4,5\n")
+
+        rows = CSVParser(infer_types=False).parse(csv_file).data['rows']
+
+        self.assertEqual(list(rows), [
+            {'a': '1', 'b': '2', 'c': ''},
+            {'a': '3', 'b': '4', 'c': '5'}
+        ])
+
+    def test_parse_csv_with_duplicate_headers(self):
+        """Test repeated header names are renamed instead of dropped."""
+        csv_file = Path(self.temp_dir) / 'duplicates.csv'
+        csv_file.write_text("a,a,b\n1,2,3\n")
+
+        result = CSVParser(infer_types=False).parse(csv_file)
+
+        self.assertEqual(result.data['columns'], ['a', 'a.1', 'b'])
+        self.assertEqual(result.data['rows'][0], {'a': '1', 'a.1': '2', 'b': '3'})
+
+    def test_parse_rows_behave_like_list(self):
+        """Test lazily built rows support len, indexing, slicing and iteration."""
+        csv_file = self.test_data_dir / 'sample.csv'
+        rows = self.parser.parse(csv_file).data['rows']
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['name'], 'Alice')
+        self.assertEqual(rows[-1]['name'], 'Eve')
+        self.assertEqual([r['name'] for r in rows[1:3]], ['Bob', 'Charlie'])
+        self.assertEqual(len(list(rows)), 5)
+        with self.assertRaises(IndexError):
+            rows[5]
+
+    def test_parse_infers_numeric_types(self):
+        """Test numeric columns are parsed to numbers only when enabled."""
+        csv_file = self.test_data_dir / 'sample.csv'
+
+        typed = CSVParser(infer_types=True).parse(csv_file).data['rows'][0]
+        self.assertEqual(typed['age'], 30)
+        self.assertEqual(typed['name'], 'Alice')
+
+        untyped = self.parser.parse(csv_file).data['rows'][0]
+        self.assertEqual(untyped['age'], '30')
+
+    def test_parse_infer_types_keeps_lossy_columns_as_text(self):
+        """Test inference never changes how a value would be written back."""
+        csv_file = Path(self.temp_dir) / 'lossy.csv'
+        csv_file.write_text(
+            "zip,flag,price,count\n"
+            "007,true,1.50,5\n"
+            "010,false,2.25,\n"
+        )
+
+        rows = CSVParser(infer_types=True).parse(csv_file).data['rows']
+
+        self.assertEqual(rows[0], {'zip': '007', 'flag': 'true', 'price': '1.50', 'count': 5})
+        self.assertIsNone(rows[1]['count'])
+
+    def test_parse_csv_with_bom_keeps_text(self):
+        """Test a BOM-prefixed header still reads every column as text."""
+        csv_file = Path(self.temp_dir) / 'excel.csv'
+        csv_file.write_text("\ufeffzip,name\n01234,Al\n00007,Bo\n", encoding='utf-8')
+
+        result = self.parser.parse(csv_file)
+
+        self.assertEqual(result.data['columns'], ['zip', 'name'])
+        self.assertEqual(result.data['rows'][0], {'zip': '01234', 'name': 'Al'})
+        self.assertEqual(result.data['rows'][1]['zip'], '00007')
+
+    def test_force_detect_semicolon_csv(self):
+        """Test .csv files are comma by default and sniffed with force_detect."""
+        csv_file = Path(self.temp_dir) / 'european.csv'
+        csv_file.write_text("name;age\nAlice;30\nBob;25\n")
+
+        self.assertEqual(self.parser._detect_delimiter(csv_file), ',')
+
+        result = CSVParser(force_detect=True).parse(csv_file)
+        self.assertEqual(result.metadata['delimiter'], ';')
+        self.assertEqual(result.data['columns'], ['name', 'age'])
+
+        # A caller-supplied delimiter skips detection altogether
+        result = self.parser.parse(csv_file, delimiter=';')
+        self.assertEqual(result.metadata['delimiter'], ';')
+        self.assertEqual(result.data['columns'], ['name', 'age'])
+
+    def test_parse_columnar_arrays(self):
+        """Test columnar mode stores one NumPy array per column."""
+        csv_file = Path(self.temp_dir) / 'columnar.csv'
+        csv_file.write_text("name,age,score\nAlice,30,1.5\nBob,25,\n")
+
+        result = CSVParser(infer_types=True, columnar=True).parse(csv_file)
+
+        self.assertNotIn('rows', result.data)
+        self.assertEqual(result.data['row_count'], 2)
+        name, age, score = result.data['arrays']
+        self.assertEqual(list(name), ['Alice', 'Bob'])
+        self.assertEqual(age.dtype.kind, 'i')
+        self.assertEqual(age.sum(), 55)
+        self.assertTrue(np.isnan(score[1]))
+
+    def test_parse_many_preserves_order(self):
+        """Test parse_many parses files concurrently, returning input order."""
+        paths = []
+        for i in range(4):
+            csv_file = Path(self.temp_dir) / f'part{i}.csv'
+            csv_file.write_text("id,value\n" + "".join(f"{j},{i}\n" for j in range(i + 1)))
+            paths.append(csv_file)
+
+        results = self.parser.parse_many(paths, max_workers=2)
+
+        self.assertEqual([r.source_file for r in results], [str(p) for p in paths])
+        self.assertEqual([r.data['row_count'] for r in results], [1, 2, 3, 4])
+        self.assertEqual(self.parser.parse_many([]), [])
+
+    def test_detect_delimiter_cached_until_file_changes(self):
+        """Test content sniffing is memoized by path, mtime and size."""
+        from data_alchemist.parsers.csv_parser import _sniff_delimiter
+
+        data_file = Path(self.temp_dir) / 'export.dat'
+        data_file.write_text("a|b\n1|2\n")
+        self.assertEqual(self.parser._detect_delimiter(data_file), '|')
+
+        hits = _sniff_delimiter.cache_info().hits
+        self.assertEqual(self.parser._detect_delimiter(data_file), '|')
+        self.assertEqual(_sniff_delimiter.cache_info().hits, hits + 1)
+
+        # Rewriting the file changes its size, so it is sniffed again
+        data_file.write_text("a;b;c\n1;2;3\n")
+        self.assertEqual(self.parser._detect_delimiter(data_file), ';')
+
+    def test_detect_delimiter_read_error_not_cached(self):
+        """Test a failed sniff falls back to comma without caching it."""
+        from unittest import mock
+
+        data_file = Path(self.temp_dir) / 'flaky.dat'
+        data_file.write_text("a|b\n1|2\n")
+
+        with mock.patch('builtins.open', side_effect=OSError("transient")):
+            self.assertEqual(self.parser._detect_delimiter(data_file), ',')
+
+        self.assertEqual(self.parser._detect_delimiter(data_file), '|')
+
     def test_parse_tsv_file(self):
         """Test parsing TSV (tab-separated) file."""
         tsv_file = self.test_data_dir / 'sample.tsv'
@@ -100,6 +252,20 @@ class TestCSVParser(unittest.TestCase):
         # Check metadata shows tab delimiter
         self.assertEqual(result.metadata.get('delimiter'), '\t')
 
+    def test_arrow_errors_get_csv_guidance(self):
+        """Test Arrow parse errors map to the same messages as pandas errors."""
+        from data_alchemist.parsers.csv_parser import PYARROW_AVAILABLE, _format_parse_error
+        if not PYARROW_AVAILABLE:
+            self.skipTest("pyarrow not installed")
+        import pyarrow as pa
+
+        path = Path('data.csv')
+        malformed = pa.ArrowInvalid("CSV parse error: Expected 3 columns, got 2")
+        empty = pa.ArrowInvalid("CSV parse error: Empty CSV file or block")
+
+        self.assertTrue(_format_parse_error(malformed, path).startswith("Malformed CSV file"))
+        self.assertTrue(_format_parse_error(empty, path).startswith("CSV file is empty"))
+
     def test_parse_empty_csv_raises_error(self):
         """Test that empty CSV raises ParserError."""
         empty_file = self.test_data_dir / 'empty.csv'
@@ -254,6 +420,89 @@ class TestLogParser(unittest.TestCase):
         self.assertEqual(result.file_type, 'log')
         self.assertGreater(result.data['entry_count'], 0)
 
+    def test_parse_line_components(self):
+        """Test timestamp, level and message are split out of common shapes."""
+        bracketed = self.parser._parse_log_line('[2024-01-15 10:30:45] ERROR: Disk full', 1)
+        self.assertEqual(bracketed['timestamp'], '2024-01-15 10:30:45')
+        self.assertEqual(bracketed['level'], 'ERROR')
+        self.assertEqual(bracketed['message'], 'Disk full')
+
+        level_first = self.parser._parse_log_line('warn | 2024-01-15 | Cache: miss', 2)
+        self.assertEqual(level_first['timestamp'], '2024-01-15')
+        self.assertEqual(level_first['level'], 'WARN')
+        self.assertEqual(level_first['message'], 'Cache: miss')
+
+        plain = self.parser._parse_log_line('no structure here', 3)
+        self.assertFalse(plain['parsed'])
+        self.assertEqual(plain['message'], 'no structure here')
+
+    def test_repeated_template_reuses_cached_offsets(self):
+        """Test lines differing only in digits share one cached template."""
+        first = self.parser._parse_log_line('2024-01-15 10:30:45 INFO user 17 logged in', 1)
+        second = self.parser._parse_log_line('2025-12-31 23:59:59 INFO user 42 logged in', 2)
+
+        self.assertEqual(len(self.parser._template_cache), 1)
+        self.assertEqual(first['message'], 'user 17 logged in')
+        self.assertEqual(second['timestamp'], '2025-12-31 23:59:59')
+        self.assertEqual(second['level'], 'INFO')
+        self.assertEqual(second['message'], 'user 42 logged in')
+
+    def test_timestamp_found_after_free_text(self):
+        """Test timestamps are found mid-line and absent from plain text."""
+        entry = self.parser._parse_log_line('user seen at 2024-01-15 10:30:45 level WARN', 1)
+        self.assertEqual(entry['timestamp'], '2024-01-15 10:30:45')
+        self.assertEqual(entry['level'], 'WARN')
+
+        entry = self.parser._parse_log_line('  File "/srv/app/main.py", line 312, in run', 2)
+        self.assertIsNone(entry['timestamp'])
+        self.assertFalse(entry['parsed'])
+
+    def test_continuation_and_comment_lines_pass_through(self):
+        """Test indented and comment lines are kept unparsed, without a level."""
+        frame = self.parser._parse_log_line('\tat com.example.Error.wrap(Error.java:42)', 1)
+        self.assertFalse(frame['parsed'])
+        self.assertIsNone(frame['level'])
+        self.assertEqual(frame['message'], '\tat com.example.Error.wrap(Error.java:42)')
+
+        comment = self.parser._parse_log_line('# rotated at 2024-01-15 00:00:00', 2)
+        self.assertFalse(comment['parsed'])
+
+        indented = self.parser._parse_log_line('  2024-01-15 10:30:45 INFO indented', 3)
+        self.assertEqual(indented['timestamp'], '2024-01-15 10:30:45')
+        self.assertEqual(indented['level'], 'INFO')
+
+    def test_block_reads_keep_line_numbers(self):
+        """Test CRLF/CR endings and lines split across read blocks."""
+        from unittest import mock
+
+        log_file = Path(self.temp_dir) / 'blocks.log'
+        log_file.write_bytes(
+            b'2024-01-15 10:30:45 INFO first\r\n'
+            b'\r\n'
+            b'2024-01-15 10:30:46 ERROR second\r'
+            b'2024-01-15 10:30:47 WARN third'
+        )
+
+        with mock.patch('data_alchemist.parsers.log_parser._READ_BLOCK_SIZE', 7):
+            entries = self.parser.parse(log_file).data['entries']
+
+        self.assertEqual([e['line_number'] for e in entries], [1, 3, 4])
+        self.assertEqual([e['message'] for e in entries], ['first', 'second', 'third'])
+
+    def test_columnar_layout_matches_entries(self):
+        """Test LogParser(columnar=True) stores the same values as field arrays."""
+        log_file = self.test_data_dir / 'sample.log'
+        entries = self.parser.parse(log_file).data['entries']
+        result = LogParser(columnar=True).parse(log_file)
+
+        self.assertNotIn('entries', result.data)
+        arrays = dict(zip(result.data['columns'], result.data['arrays']))
+        self.assertIsInstance(arrays['line_number'], np.ndarray)
+        self.assertEqual(arrays['line_number'].dtype, np.int32)
+        self.assertEqual(len(arrays['message']), result.data['entry_count'])
+        for name, values in arrays.items():
+            self.assertEqual(list(values), [entry[name] for entry in entries])
+
     def test_parse_includes_metadata(self):
         """Test that parsed data includes metadata."""
         log_file = self.test_data_dir / 'sample.log'